@@ -7,26 +7,29 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import os
 import shutil
 import sys
 import time
 
+import orjson
 import pexpect
 
 COLS = 120
 ROWS = 35
 PAD = 1  # columns/rows of padding on all sides
 CAST_PATH = "docs/demo.cast"
+TYPE_CHUNK = 4  # characters sent per write when simulating typing
+TYPE_DELAY = 0.04  # seconds per character
 
 
 class CastLogger:
     """Logs pexpect output to both stdout and an asciinema v2 cast file."""
 
     def __init__(self, path: str, width: int, height: int, pad: int) -> None:
-        self.f = open(path, "w")
+        self.f = open(path, "wb")
         self.pad = pad
+        self._newline_pad = "\n" + " " * pad
         self.first_write = True
         header = {
             "version": 2,
@@ -35,7 +38,7 @@ class CastLogger:
             "timestamp": int(time.time()),
             "env": {"SHELL": "/bin/zsh", "TERM": "xterm-256color"},
         }
-        self.f.write(json.dumps(header) + "\n")
+        self.f.write(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
         self.start = time.time()
 
     def write(self, data: bytes) -> None:
@@ -44,12 +47,14 @@ class CastLogger:
         # Add top padding on first write
         if self.first_write:
             top_pad = "\n" * self.pad + " " * self.pad
-            self.f.write(json.dumps([round(elapsed, 6), "o", top_pad]) + "\n")
+            self.f.write(
+                orjson.dumps([round(elapsed, 6), "o", top_pad], option=orjson.OPT_APPEND_NEWLINE)
+            )
             self.first_write = False
         # Add left padding after each newline
         if self.pad:
-            text = text.replace("\n", "\n" + " " * self.pad)
-        self.f.write(json.dumps([round(elapsed, 6), "o", text]) + "\n")
+            text = text.replace("\n", self._newline_pad)
+        self.f.write(orjson.dumps([round(elapsed, 6), "o", text], option=orjson.OPT_APPEND_NEWLINE))
         sys.stdout.buffer.write(data)
         sys.stdout.buffer.flush()
 
@@ -60,6 +65,14 @@ class CastLogger:
         self.f.close()
 
 
+def type_text(child: pexpect.spawn, text: str) -> None:
+    """Simulate typing in small chunks: one write and one sleep per chunk."""
+    for i in range(0, len(text), TYPE_CHUNK):
+        chunk = text[i : i + TYPE_CHUNK]
+        child.send(chunk)
+        time.sleep(TYPE_DELAY * len(chunk))
+
+
 def main() -> None:
     env = os.environ.copy()
     env["PROMPT_TOOLKIT_NO_CPR"] = "1"
@@ -91,9 +104,7 @@ def main() -> None:
     child.send("\x01")  # Ctrl+A
     child.send("\x0b")  # Ctrl+K
     time.sleep(0.3)
-    for c in "./docs/demo_images":
-        child.send(c)
-        time.sleep(0.04)
+    type_text(child, "./docs/demo_images")
     time.sleep(0.3)
     child.sendline("")
 
@@ -1,6 +1,11 @@
-try:
-    from importlib.metadata import version
+def __getattr__(name: str) -> str:
+    # Resolve the version lazily: importlib.metadata is one of the slowest imports
+    # on the CLI startup path and only `--version` needs it.
+    if name == "__version__":
+        try:
+            from importlib.metadata import version
 
-    __version__ = version("imgeda")
-except Exception:
-    __version__ = "0.0.0"
+            return version("imgeda")
+        except Exception:
+            return "0.0.0"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
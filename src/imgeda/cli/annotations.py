@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 from typing import Optional
 
-import orjson
 import typer
 from rich.console import Console
 
-from imgeda.core.annotations import analyze_annotations
-from imgeda.core.format_detector import detect_format
+from imgeda.io.json_io import write_json
 
 console = Console()
 
@@ -32,9 +31,13 @@ def annotations_cmd(
         console.print(f"[red]Not a directory: {directory}[/red]")
         raise typer.Exit(1)
 
-    # Auto-detect format if not provided
+    from imgeda.core.annotations import analyze_annotations
+    from imgeda.core.format_detector import DatasetInfo, detect_format_cached
+
+    # Auto-detect format if not provided; the result is reused for YOLO class names
+    info: DatasetInfo | None = None
     if fmt is None:
-        info = detect_format(directory)
+        info = detect_format_cached(directory)
         fmt = info.format
         console.print(f"[dim]Detected format: {fmt}[/dim]")
     else:
@@ -47,7 +50,8 @@ def annotations_cmd(
     # Get class names from format detector for YOLO
     class_names: list[str] | None = None
     if fmt == "yolo":
-        info = detect_format(directory)
+        if info is None:
+            info = detect_format_cached(directory)
         class_names = info.class_names or None
 
     stats = analyze_annotations(
@@ -63,33 +67,33 @@ def annotations_cmd(
         raise typer.Exit(0)
 
     # Display summary
-    console.print("\n[bold]Annotation Analysis[/bold]")
-    console.print(f"  Images: {stats.total_images:,} ({stats.annotated_images:,} annotated)")
-    console.print(f"  Total annotations: {stats.total_annotations:,}")
-    console.print(f"  Classes: {stats.num_classes}")
-    console.print(f"  Avg objects/image: {stats.mean_objects_per_image:.1f}")
-    console.print(f"  Max objects/image: {stats.max_objects_per_image}")
-    console.print(
-        f"  Size breakdown: {stats.small_count:,} small / "
-        f"{stats.medium_count:,} medium / {stats.large_count:,} large"
-    )
+    lines = [
+        "\n[bold]Annotation Analysis[/bold]",
+        f"  Images: {stats.total_images:,} ({stats.annotated_images:,} annotated)",
+        f"  Total annotations: {stats.total_annotations:,}",
+        f"  Classes: {stats.num_classes}",
+        f"  Avg objects/image: {stats.mean_objects_per_image:.1f}",
+        f"  Max objects/image: {stats.max_objects_per_image}",
+        (
+            f"  Size breakdown: {stats.small_count:,} small / "
+            f"{stats.medium_count:,} medium / {stats.large_count:,} large"
+        ),
+    ]
 
     # Class distribution (top 20)
-    console.print("\n[bold]Class Distribution (top 20):[/bold]")
-    for cls, count in list(stats.class_counts.items())[:20]:
+    lines.append("\n[bold]Class Distribution (top 20):[/bold]")
+    for cls, count in itertools.islice(stats.class_counts.items(), 20):
         pct = count / stats.total_annotations * 100
-        bar = "█" * int(pct / 2)
-        console.print(f"  {cls:30s} {count:>8,} ({pct:5.1f}%) {bar}")
+        lines.append(f"  {cls:30s} {count:>8,} ({pct:5.1f}%) {'█' * int(pct / 2)}")
 
     if stats.orphan_images:
-        console.print(f"\n[yellow]  {len(stats.orphan_images)} unannotated images[/yellow]")
+        lines.append(f"\n[yellow]  {len(stats.orphan_images)} unannotated images[/yellow]")
     if stats.orphan_annotations:
-        console.print(
+        lines.append(
             f"[yellow]  {len(stats.orphan_annotations)} annotations without images[/yellow]"
         )
+    console.print("\n".join(lines))
 
     if output:
-        data = orjson.dumps(stats.to_dict(), option=orjson.OPT_INDENT_2)
-        with open(output, "wb") as f:
-            f.write(data)
+        write_json(output, stats.to_dict())
         console.print(f"\n[green]Saved to {output}[/green]")
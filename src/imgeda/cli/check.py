@@ -2,32 +2,57 @@
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-import orjson
 import typer
 from rich.console import Console
 
-from imgeda.io.manifest_io import read_manifest
+from imgeda.io.json_io import write_json, write_jsonl
+from imgeda.io.manifest_io import iter_manifest, read_manifest
 from imgeda.models.manifest import ImageRecord
 
 check_app = typer.Typer(help="Check for issues in a manifest.")
 console = Console()
 
 
-def _load_records(manifest: str) -> list[ImageRecord]:
-    _meta, records = read_manifest(manifest)
-    if not records:
+def _iter_records(manifest: str) -> Iterator[ImageRecord]:
+    """Stream records for single-pass checks, exiting early on an empty manifest."""
+    records = iter_manifest(manifest)
+    first = next(records, None)
+    if first is None:
         console.print("[red]No records found in manifest.[/red]")
         raise typer.Exit(1)
-    return records
+    return itertools.chain((first,), records)
 
 
-def _output_results(results: list[dict[str, Any]], output: Optional[str], label: str) -> None:
+def _check_output_format(output_format: str) -> None:
+    if output_format not in ("json", "jsonl"):
+        console.print(f"[red]Unknown output format: {output_format} (use json or jsonl)[/red]")
+        raise typer.Exit(1)
+
+
+def _output_results(
+    results: Iterable[dict[str, Any]],
+    output: Optional[str],
+    label: str,
+    compact: Optional[bool] = None,
+    output_format: str = "json",
+) -> None:
+    _check_output_format(output_format)
+    if output and output_format == "jsonl":
+        # Stream straight to disk: results may be a generator over the manifest
+        count = write_jsonl(output, results)
+        console.print(f"[bold]{label}:[/bold] {count:,} found")
+        console.print(f"[green]Saved to {output}[/green]")
+        return
+
+    results = list(results)
     console.print(f"[bold]{label}:[/bold] {len(results):,} found")
     if output:
-        with open(output, "wb") as f:
-            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        write_json(output, results, compact=compact, n_items=len(results))
         console.print(f"[green]Saved to {output}[/green]")
     elif results:
         for item in results[:20]:
@@ -38,21 +63,30 @@ def _output_results(results: list[dict[str, Any]], output: Optional[str], label:
 
 _manifest_opt = typer.Option(..., "-m", "--manifest", help="Path to manifest JSONL")
 _output_opt = typer.Option(None, "-o", "--output", help="Output JSON path")
+_compact_opt = typer.Option(
+    None,
+    "--compact/--indent",
+    help="Write compact JSON (default: compact above 10,000 results, indented otherwise)",
+)
+_format_opt = typer.Option(
+    "json", "--output-format", help="Output file format: json, or jsonl to stream results"
+)
 
 
 @check_app.command()
-def corrupt(manifest: str = _manifest_opt, output: Optional[str] = _output_opt) -> None:
+def corrupt(
+    manifest: str = _manifest_opt,
+    output: Optional[str] = _output_opt,
+    compact: Optional[bool] = _compact_opt,
+    output_format: str = _format_opt,
+) -> None:
     """List corrupt images."""
-    records = _load_records(manifest)
-    results = [{"path": r.path, "filename": r.filename} for r in records if r.is_corrupt]
-    _output_results(results, output, "Corrupt images")
+    records = _iter_records(manifest)
+    results = ({"path": r.path, "filename": r.filename} for r in records if r.is_corrupt)
+    _output_results(results, output, "Corrupt images", compact, output_format)
 
 
-@check_app.command()
-def exposure(manifest: str = _manifest_opt, output: Optional[str] = _output_opt) -> None:
-    """List dark and overexposed images."""
-    records = _load_records(manifest)
-    results = []
+def _exposure_issues(records: Iterable[ImageRecord]) -> Iterator[dict[str, Any]]:
     for r in records:
         issues = []
         if r.is_dark:
@@ -61,63 +95,83 @@ def exposure(manifest: str = _manifest_opt, output: Optional[str] = _output_opt)
             issues.append("overexposed")
         if issues:
             brightness = r.pixel_stats.mean_brightness if r.pixel_stats else None
-            results.append({"path": r.path, "issues": issues, "mean_brightness": brightness})
-    _output_results(results, output, "Exposure issues")
+            yield {"path": r.path, "issues": issues, "mean_brightness": brightness}
 
 
 @check_app.command()
-def artifacts(manifest: str = _manifest_opt, output: Optional[str] = _output_opt) -> None:
+def exposure(
+    manifest: str = _manifest_opt,
+    output: Optional[str] = _output_opt,
+    compact: Optional[bool] = _compact_opt,
+    output_format: str = _format_opt,
+) -> None:
+    """List dark and overexposed images."""
+    _output_results(
+        _exposure_issues(_iter_records(manifest)),
+        output,
+        "Exposure issues",
+        compact,
+        output_format,
+    )
+
+
+@check_app.command()
+def artifacts(
+    manifest: str = _manifest_opt,
+    output: Optional[str] = _output_opt,
+    compact: Optional[bool] = _compact_opt,
+    output_format: str = _format_opt,
+) -> None:
     """List images with border artifacts."""
-    records = _load_records(manifest)
-    results = [
+    records = _iter_records(manifest)
+    results = (
         {
             "path": r.path,
             "delta": r.corner_stats.delta if r.corner_stats else None,
         }
         for r in records
         if r.has_border_artifact
-    ]
-    _output_results(results, output, "Border artifacts")
+    )
+    _output_results(results, output, "Border artifacts", compact, output_format)
 
 
 @check_app.command(name="duplicates")
-def duplicates_cmd(manifest: str = _manifest_opt, output: Optional[str] = _output_opt) -> None:
+def duplicates_cmd(
+    manifest: str = _manifest_opt,
+    output: Optional[str] = _output_opt,
+    compact: Optional[bool] = _compact_opt,
+    output_format: str = _format_opt,
+) -> None:
     """Find duplicate image groups."""
     from imgeda.core.duplicates import find_exact_duplicates, find_near_duplicates
 
-    records = _load_records(manifest)
-
-    exact = find_exact_duplicates(records)
-    near = find_near_duplicates(records)
-
-    results = []
-    for phash, group in exact.items():
-        results.append(
-            {
-                "type": "exact",
-                "phash": phash,
-                "count": len(group),
-                "paths": [r.path for r in group],
-            }
-        )
-    for group in near:
-        results.append(
-            {
-                "type": "near",
-                "count": len(group),
-                "paths": [r.path for r in group],
-            }
-        )
-
-    _output_results(results, output, "Duplicate groups")
+    # Only hashed, non-corrupt records can take part in a duplicate group
+    hashable = [r for r in _iter_records(manifest) if r.phash and not r.is_corrupt]
+    exact = find_exact_duplicates(hashable)
+    near = find_near_duplicates(hashable)
+
+    results: list[dict[str, Any]] = [
+        {"type": "exact", "phash": phash, "count": len(group), "paths": [r.path for r in group]}
+        for phash, group in exact.items()
+    ]
+    results.extend(
+        {"type": "near", "count": len(group), "paths": [r.path for r in group]} for group in near
+    )
+
+    _output_results(results, output, "Duplicate groups", compact, output_format)
 
 
 @check_app.command()
-def blur(manifest: str = _manifest_opt, output: Optional[str] = _output_opt) -> None:
+def blur(
+    manifest: str = _manifest_opt,
+    output: Optional[str] = _output_opt,
+    compact: Optional[bool] = _compact_opt,
+    output_format: str = _format_opt,
+) -> None:
     """List blurry images."""
-    records = _load_records(manifest)
-    results = [{"path": r.path, "blur_score": r.blur_score} for r in records if r.is_blurry]
-    _output_results(results, output, "Blurry images")
+    records = _iter_records(manifest)
+    results = ({"path": r.path, "blur_score": r.blur_score} for r in records if r.is_blurry)
+    _output_results(results, output, "Blurry images", compact, output_format)
 
 
 @check_app.command()
@@ -127,25 +181,34 @@ def leakage(
     ),
     threshold: int = typer.Option(8, "--threshold", help="Hamming distance threshold"),
     output: Optional[str] = _output_opt,
+    compact: Optional[bool] = _compact_opt,
+    output_format: str = _format_opt,
 ) -> None:
     """Detect duplicate images across splits (data leakage)."""
     if len(manifests) < 2:
         console.print("[red]Provide at least 2 manifests for leakage detection.[/red]")
         raise typer.Exit(1)
+    _check_output_format(output_format)
 
     from imgeda.core.leakage import detect_leakage
 
+    # Split manifests are independent files; read them concurrently so disk
+    # (or network filesystem) latency overlaps. map() keeps the CLI order.
+    with ThreadPoolExecutor(max_workers=len(manifests)) as pool:
+        loaded = list(pool.map(read_manifest, manifests))
+
     all_records: dict[str, list[ImageRecord]] = {}
-    for m in manifests:
-        meta, recs = read_manifest(m)
+    for m, (meta, recs) in zip(manifests, loaded):
         label = meta.input_dir if meta else m
         all_records[label] = recs
 
     result = detect_leakage(all_records, threshold)
     console.print(f"\n[bold]Cross-split leakage:[/bold] {len(result):,} leaked images")
     if output:
-        with open(output, "wb") as f:
-            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        if output_format == "jsonl":
+            write_jsonl(output, result)
+        else:
+            write_json(output, result, compact=compact, n_items=len(result))
         console.print(f"[green]Saved to {output}[/green]")
     elif result:
         for item in result[:20]:
@@ -161,35 +224,38 @@ def all_checks(manifest: str = _manifest_opt, output: Optional[str] = _output_op
 
     console.print("[bold]Running all checks...[/bold]\n")
 
-    records = _load_records(manifest)
-
-    # Corrupt
-    corrupt_list = [r for r in records if r.is_corrupt]
-    console.print(
-        f"  Corrupt: [{'red' if corrupt_list else 'green'}]{len(corrupt_list):,}"
-        f"[/{'red' if corrupt_list else 'green'}]"
-    )
-
-    # Exposure
-    dark = [r for r in records if r.is_dark]
-    overexposed = [r for r in records if r.is_overexposed]
-    console.print(f"  Dark: [yellow]{len(dark):,}[/yellow]")
-    console.print(f"  Overexposed: [yellow]{len(overexposed):,}[/yellow]")
-
-    # Blur
-    blurry = [r for r in records if r.is_blurry]
-    console.print(f"  Blurry: [yellow]{len(blurry):,}[/yellow]")
-
-    # Artifacts
-    artifacts_list = [r for r in records if r.has_border_artifact]
-    console.print(f"  Border artifacts: [yellow]{len(artifacts_list):,}[/yellow]")
+    # Single pass over the manifest: count every flag and keep only the records
+    # duplicate detection needs (hashed, non-corrupt).
+    n_corrupt = n_dark = n_over = n_blurry = n_artifacts = 0
+    hashable: list[ImageRecord] = []
+    for r in _iter_records(manifest):
+        if r.is_corrupt:
+            n_corrupt += 1
+        elif r.phash:
+            hashable.append(r)
+        if r.is_dark:
+            n_dark += 1
+        if r.is_overexposed:
+            n_over += 1
+        if r.is_blurry:
+            n_blurry += 1
+        if r.has_border_artifact:
+            n_artifacts += 1
 
     # Duplicates (both exact and near)
-    exact = find_exact_duplicates(records)
-    near = find_near_duplicates(records)
+    exact = find_exact_duplicates(hashable)
+    near = find_near_duplicates(hashable)
     exact_dup_count = sum(len(v) - 1 for v in exact.values())
     near_dup_groups = len(near)
-    console.print(
-        f"  Exact duplicates: [yellow]{exact_dup_count:,}[/yellow] (in {len(exact):,} groups)"
-    )
-    console.print(f"  Near-duplicate groups: [yellow]{near_dup_groups:,}[/yellow]")
+
+    corrupt_style = "red" if n_corrupt else "green"
+    summary = [
+        f"  Corrupt: [{corrupt_style}]{n_corrupt:,}[/{corrupt_style}]",
+        f"  Dark: [yellow]{n_dark:,}[/yellow]",
+        f"  Overexposed: [yellow]{n_over:,}[/yellow]",
+        f"  Blurry: [yellow]{n_blurry:,}[/yellow]",
+        f"  Border artifacts: [yellow]{n_artifacts:,}[/yellow]",
+        f"  Exact duplicates: [yellow]{exact_dup_count:,}[/yellow] (in {len(exact):,} groups)",
+        f"  Near-duplicate groups: [yellow]{near_dup_groups:,}[/yellow]",
+    ]
+    console.print("\n".join(summary))
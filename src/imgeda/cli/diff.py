@@ -5,11 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import orjson
 import typer
 from rich.console import Console
 
-from imgeda.core.diff import diff_manifests
+from imgeda.io.json_io import write_json
 from imgeda.io.manifest_io import read_manifest
 
 console = Console()
@@ -19,6 +18,11 @@ def diff(
     old: str = typer.Option(..., "--old", help="Path to old manifest JSONL"),
     new: str = typer.Option(..., "--new", help="Path to new manifest JSONL"),
     output: Optional[str] = typer.Option(None, "-o", "--out", help="Output JSON path"),
+    compact: Optional[bool] = typer.Option(
+        None,
+        "--compact/--indent",
+        help="Write compact JSON (default: compact above 10,000 entries, indented otherwise)",
+    ),
 ) -> None:
     """Compare two manifests and show differences."""
     if not Path(old).exists():
@@ -35,28 +39,31 @@ def diff(
         console.print("[yellow]Both manifests are empty.[/yellow]")
         raise typer.Exit(0)
 
+    from imgeda.core.diff import diff_manifests
+
     result = diff_manifests(old_records, new_records)
     summary = result.summary
 
     # Display summary
-    console.print("\n[bold]Manifest Diff[/bold]")
-    console.print(f"  Old: {summary.total_old:,} images")
-    console.print(f"  New: {summary.total_new:,} images")
-    console.print()
-    console.print(f"  [green]Added:[/green]     {summary.added_count:,}")
-    console.print(f"  [red]Removed:[/red]   {summary.removed_count:,}")
-    console.print(f"  [yellow]Changed:[/yellow]   {summary.changed_count:,}")
-    console.print(f"  Unchanged: {result.unchanged_count:,}")
-
+    lines = [
+        "\n[bold]Manifest Diff[/bold]",
+        f"  Old: {summary.total_old:,} images",
+        f"  New: {summary.total_new:,} images",
+        "",
+        f"  [green]Added:[/green]     {summary.added_count:,}",
+        f"  [red]Removed:[/red]   {summary.removed_count:,}",
+        f"  [yellow]Changed:[/yellow]   {summary.changed_count:,}",
+        f"  Unchanged: {result.unchanged_count:,}",
+    ]
     if summary.corrupt_old != summary.corrupt_new:
-        console.print(f"\n  Corrupt: {summary.corrupt_old} -> {summary.corrupt_new}")
+        lines.append(f"\n  Corrupt: {summary.corrupt_old} -> {summary.corrupt_new}")
     if summary.duplicate_groups_old != summary.duplicate_groups_new:
-        console.print(
+        lines.append(
             f"  Duplicate groups: {summary.duplicate_groups_old} -> {summary.duplicate_groups_new}"
         )
+    console.print("\n".join(lines))
 
     if output:
-        data = orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2)
-        with open(output, "wb") as f:
-            f.write(data)
+        n_items = summary.added_count + summary.removed_count + summary.changed_count
+        write_json(output, result.to_dict(), compact=compact, n_items=n_items)
         console.print(f"\n[green]Saved to {output}[/green]")
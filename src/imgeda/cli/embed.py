@@ -7,21 +7,25 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress
 
-from imgeda.io.manifest_io import read_manifest
-from imgeda.models.config import PlotConfig
+from imgeda.io.image_reader import filter_existing
+from imgeda.io.manifest_io import iter_manifest
 
 console = Console()
 
 
 def embed(
     manifest: str = typer.Option(..., "-m", "--manifest", help="Path to manifest JSONL"),
-    output: str = typer.Option("./embeddings.npz", "-o", "--out", help="Output .npz file path"),
+    output: str = typer.Option(
+        "./embeddings.npz", "-o", "--out", help="Output .npz (or memory-mappable .npy) file path"
+    ),
     model: str = typer.Option("ViT-B-32", "--model", help="OpenCLIP model name"),
     pretrained: str = typer.Option("laion2b_s34b_b79k", "--pretrained", help="Pretrained weights"),
     batch_size: int = typer.Option(32, "--batch-size", help="Inference batch size"),
     device: Optional[str] = typer.Option(None, "--device", help="Torch device (auto-detected)"),
+    quantize: bool = typer.Option(
+        False, "--int8/--float32", help="Store embeddings as int8 (4x smaller)"
+    ),
     plot: bool = typer.Option(True, "--plot/--no-plot", help="Generate UMAP plot"),
     plot_dir: str = typer.Option("./plots", "--plot-dir", help="Plot output directory"),
 ) -> None:
@@ -29,6 +33,8 @@ def embed(
 
     Requires: pip install imgeda[embeddings]
     """
+    from rich.progress import Progress
+
     from imgeda.core.embeddings import (
         _check_deps,
         compute_embeddings,
@@ -49,19 +55,26 @@ def embed(
     if not Path(manifest).exists():
         console.print(f"[red]Manifest not found: {manifest}[/red]")
         raise typer.Exit(1)
+    if quantize and output.endswith(".npy"):
+        console.print("[red]--int8 requires an .npz output path[/red]")
+        raise typer.Exit(1)
 
-    _, records = read_manifest(manifest)
-    if not records:
+    # Filter to non-corrupt images that exist; existence is checked per directory
+    total = 0
+    candidates: list[str] = []
+    for r in iter_manifest(manifest):
+        total += 1
+        if not r.is_corrupt:
+            candidates.append(r.path)
+    paths = filter_existing(candidates)
+
+    if not total:
         console.print("[yellow]No records in manifest.[/yellow]")
         raise typer.Exit(1)
-
-    # Filter to non-corrupt images that exist
-    valid = [r for r in records if not r.is_corrupt and Path(r.path).exists()]
-    if not valid:
+    if not paths:
         console.print("[yellow]No valid images found.[/yellow]")
         raise typer.Exit(1)
 
-    paths = [r.path for r in valid]
     console.print(f"Computing embeddings for {len(paths):,} images...")
 
     with Progress() as progress:
@@ -79,7 +92,7 @@ def embed(
             progress_callback=callback,
         )
 
-    save_embeddings(embeddings, paths, output)
+    save_embeddings(embeddings, paths, output, quantize=quantize)
     console.print(f"[green]Saved embeddings ({embeddings.shape}) to {output}[/green]")
 
     # Outlier detection
@@ -103,6 +116,7 @@ def embed(
             )
             return
 
+        from imgeda.models.config import PlotConfig
         from imgeda.plotting.embeddings import plot_umap
 
         plot_config = PlotConfig(output_dir=plot_dir)
@@ -7,7 +7,7 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from imgeda.io.manifest_io import read_manifest
+from imgeda.io.manifest_io import iter_manifest, read_manifest
 
 export_app = typer.Typer(help="Export manifest to other formats.")
 console = Console()
@@ -55,13 +55,11 @@ def csv(
         console.print(f"[red]Manifest not found: {manifest}[/red]")
         raise typer.Exit(1)
 
-    _, records = read_manifest(manifest)
+    from imgeda.io.csv_io import records_to_csv
 
-    if not records:
+    row_count = records_to_csv(iter_manifest(manifest), output)
+    if not row_count:
         console.print("[yellow]No records found in manifest.[/yellow]")
         raise typer.Exit(1)
 
-    from imgeda.io.csv_io import records_to_csv
-
-    row_count = records_to_csv(records, output)
     console.print(f"[green]Exported {row_count:,} records to {output}[/green]")
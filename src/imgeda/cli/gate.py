@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Optional
 
-import orjson
 import typer
 from rich.console import Console
 
-from imgeda.core.gate import evaluate_policy, load_policy
+from imgeda.io.json_io import write_json
 from imgeda.io.manifest_io import read_manifest
 
 console = Console()
@@ -31,31 +31,43 @@ def gate(
         console.print(f"[red]Policy file not found: {policy_path}[/red]")
         raise typer.Exit(1)
 
+    from imgeda.core.gate import evaluate_policy, load_policy
+
     _, records = read_manifest(manifest)
     policy = load_policy(policy_path)
     result = evaluate_policy(records, policy)
 
-    # Display results
-    console.print(f"\n[bold]Quality Gate ({result.total_images:,} images)[/bold]\n")
+    # Display results. In CI (stdout not a terminal) the report is written as
+    # plain text in one call instead of going through Rich's renderer per line.
+    plain = not console.is_terminal
+
+    def style(text: str, markup: str) -> str:
+        return text if plain else f"[{markup}]{text}[/{markup}]"
+
+    lines = [f"\n{style(f'Quality Gate ({result.total_images:,} images)', 'bold')}\n"]
     for check in result.checks:
-        status = "[green]PASS[/green]" if check.passed else "[red]FAIL[/red]"
-        console.print(f"  {status}  {check.name}: {check.observed} (threshold: {check.threshold})")
+        status = style("PASS", "green") if check.passed else style("FAIL", "red")
+        lines.append(f"  {status}  {check.name}: {check.observed} (threshold: {check.threshold})")
         if not check.passed and check.sample_paths:
-            for p in check.sample_paths[:5]:
-                console.print(f"         {p}")
+            lines.extend(f"         {p}" for p in check.sample_paths[:5])
             if len(check.sample_paths) > 5:
-                console.print(f"         ... and {len(check.sample_paths) - 5} more")
+                lines.append(f"         ... and {len(check.sample_paths) - 5} more")
 
-    console.print()
+    lines.append("")
     if result.passed:
-        console.print("[bold green]Gate: PASSED[/bold green]")
+        lines.append(style("Gate: PASSED", "bold green"))
+    else:
+        lines.append(style("Gate: FAILED", "bold red"))
+
+    report = "\n".join(lines)
+    if plain:
+        sys.stdout.write(report + "\n")
+        sys.stdout.flush()
     else:
-        console.print("[bold red]Gate: FAILED[/bold red]")
+        console.print(report)
 
     if output:
-        data = orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2)
-        with open(output, "wb") as f:
-            f.write(data)
+        write_json(output, result.to_dict())
         console.print(f"[green]Saved to {output}[/green]")
 
     if not result.passed:
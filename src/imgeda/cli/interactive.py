@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import contextlib
+import importlib
 import os
+import threading
 from pathlib import Path
 
 import questionary
@@ -10,8 +13,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from imgeda.core.format_detector import DatasetInfo, detect_format
-from imgeda.io.image_reader import discover_images
+from imgeda.core.format_detector import DatasetInfo, detect_format_cached
+from imgeda.io.image_reader import discover_images, estimate_total_size
 from imgeda.models.config import ScanConfig
 from imgeda.utils import fmt_bytes
 
@@ -19,6 +22,17 @@ console = Console()
 
 DEFAULT_EXTENSIONS = ScanConfig().extensions
 
+# Plots drawn after a wizard scan (names from imgeda.plotting.registry.PLOTS)
+_WIZARD_PLOTS = (
+    "dimensions",
+    "file_size",
+    "aspect_ratio",
+    "brightness",
+    "channels",
+    "artifacts",
+    "duplicates",
+)
+
 
 def _format_dataset_panel(info: DatasetInfo) -> Panel:
     """Build a Rich panel showing detected dataset info."""
@@ -78,6 +92,16 @@ def _resolve_image_dirs(info: DatasetInfo, selected_splits: list[str]) -> list[s
     return selected if selected else info.image_dirs
 
 
+def _warm_scan_imports() -> None:
+    """Import the scan pipeline (numpy, Pillow, analyzers) ahead of first use.
+
+    Runs in a background thread while the user answers prompts, so the scan
+    starts without an import pause. Failures are left for the real import.
+    """
+    with contextlib.suppress(ImportError):
+        importlib.import_module("imgeda.pipeline.runner")
+
+
 def run_interactive() -> None:
     """Launch the interactive configuration wizard."""
     console.print("\n[bold blue]Welcome to imgeda \u2014 Image Dataset EDA Tool[/bold blue]\n")
@@ -96,9 +120,11 @@ def run_interactive() -> None:
         console.print(f"[red]Error: {directory} is not a valid directory[/red]")
         return
 
+    threading.Thread(target=_warm_scan_imports, daemon=True).start()
+
     # 2. Format detection
     console.print("  Detecting dataset format\u2026\n")
-    info = detect_format(str(dir_path))
+    info = detect_format_cached(str(dir_path))
     console.print(_format_dataset_panel(info))
     console.print()
 
@@ -109,11 +135,7 @@ def run_interactive() -> None:
             console.print("[yellow]No images found. Check the directory path.[/yellow]")
             return
         # Update info with discovered count
-        try:
-            total_size = sum(os.path.getsize(p) for p in images[:1000])
-        except OSError:
-            total_size = 0
-        est_size = total_size * len(images) / min(len(images), 1000) if images else 0
+        est_size = estimate_total_size(images)
         console.print(f"  Found [bold]{len(images):,}[/bold] images (~{fmt_bytes(est_size)})\n")
 
     # 3. Split selection (if splits detected)
@@ -201,39 +223,24 @@ def run_interactive() -> None:
     if generate_report:
         from imgeda.io.manifest_io import read_manifest
         from imgeda.models.config import PlotConfig
-        from imgeda.plotting.aspect_ratio import plot_aspect_ratio
-        from imgeda.plotting.artifacts import plot_artifacts
-        from imgeda.plotting.dimensions import plot_dimensions
-        from imgeda.plotting.duplicates import plot_duplicates
-        from imgeda.plotting.file_size import plot_file_size
-        from imgeda.plotting.pixel_stats import plot_brightness, plot_channels
+        from imgeda.plotting.registry import render_plots
 
         console.print("\n[bold]Generating plots\u2026[/bold]\n")
         _meta, records = read_manifest(output)
         plot_config = PlotConfig(output_dir="./plots")
 
-        for name, fn in [
-            ("Dimensions", plot_dimensions),
-            ("File size", plot_file_size),
-            ("Aspect ratio", plot_aspect_ratio),
-            ("Brightness", plot_brightness),
-            ("Channels", plot_channels),
-            ("Artifacts", plot_artifacts),
-            ("Duplicates", plot_duplicates),
-        ]:
-            try:
-                path = fn(records, plot_config)
+        for name, path, error in render_plots(records, plot_config, _WIZARD_PLOTS):
+            if error is None:
                 console.print(f"  [green]{name}:[/green] {path}")
-            except Exception as e:
-                console.print(f"  [red]{name}: {e}[/red]")
+            else:
+                console.print(f"  [red]{name}: {error}[/red]")
 
         # Generate HTML report
         console.print("\n[bold]Generating HTML report\u2026[/bold]\n")
-        from imgeda.cli.report import report as report_cmd
+        from imgeda.cli.report import generate_report
 
-        try:
-            report_cmd(manifest=output, output="./imgeda_report.html")
-        except SystemExit:
-            pass  # typer.Exit raised when manifest has no records
+        # Reuse the records loaded for plotting rather than re-reading the manifest
+        if records:
+            generate_report(records, "./imgeda_report.html")
 
     console.print("\n[bold green]Done![/bold green]")
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Optional
 
 import typer
 from rich.console import Console
 
-from imgeda.io.manifest_io import read_manifest
+from imgeda.io.manifest_io import iter_manifest, read_manifest, read_meta
 from imgeda.models.config import PlotConfig
 from imgeda.models.manifest import ImageRecord
+from imgeda.plotting.registry import plot_fn, render_plots
 
 plot_app = typer.Typer(help="Generate plots from a manifest.")
 console = Console()
@@ -23,8 +25,27 @@ def _load_and_config(
     sample: Optional[int],
     seed: int = 42,
 ) -> tuple[list[ImageRecord], PlotConfig]:
-    _meta, records = read_manifest(manifest)
-    if not records:
+    if sample is None:
+        _meta, records = read_manifest(manifest)
+        n_records = len(records)
+    else:
+        from imgeda.plotting.base import reservoir_sample
+
+        # Sample while streaming so the full manifest is never held in memory;
+        # corrupt records are skipped up front, as prepare_records would, but
+        # still counted so an all-corrupt manifest is not reported as empty.
+        _meta = read_meta(manifest)
+        n_records = 0
+
+        def _valid() -> Iterator[ImageRecord]:
+            nonlocal n_records
+            for r in iter_manifest(manifest):
+                n_records += 1
+                if not r.is_corrupt:
+                    yield r
+
+        records = reservoir_sample(_valid(), sample, seed)
+    if not n_records:
         console.print("[red]No records found in manifest.[/red]")
         raise typer.Exit(1)
     # Carry artifact threshold from scan settings if available
@@ -42,6 +63,20 @@ def _load_and_config(
     return records, config
 
 
+def _run_plot(
+    name: str,
+    manifest: str,
+    output: str,
+    fmt: str,
+    dpi: int,
+    sample: Optional[int],
+    seed: int,
+) -> None:
+    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
+    path = plot_fn(name)(records, config)
+    console.print(f"[green]Saved:[/green] {path}")
+
+
 # Common options
 _manifest_opt = typer.Option(..., "-m", "--manifest", help="Path to manifest JSONL")
 _output_opt = typer.Option("./plots", "-o", "--output", help="Output directory")
@@ -61,11 +96,7 @@ def dimensions(
     seed: int = _seed_opt,
 ) -> None:
     """Plot image dimensions (width x height)."""
-    from imgeda.plotting.dimensions import plot_dimensions
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_dimensions(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("dimensions", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -78,11 +109,7 @@ def file_size(
     seed: int = _seed_opt,
 ) -> None:
     """Plot file size distribution."""
-    from imgeda.plotting.file_size import plot_file_size
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_file_size(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("file_size", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -95,11 +122,7 @@ def aspect_ratio(
     seed: int = _seed_opt,
 ) -> None:
     """Plot aspect ratio distribution."""
-    from imgeda.plotting.aspect_ratio import plot_aspect_ratio
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_aspect_ratio(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("aspect_ratio", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -112,11 +135,7 @@ def brightness(
     seed: int = _seed_opt,
 ) -> None:
     """Plot brightness distribution."""
-    from imgeda.plotting.pixel_stats import plot_brightness
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_brightness(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("brightness", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -129,11 +148,7 @@ def channels(
     seed: int = _seed_opt,
 ) -> None:
     """Plot R/G/B channel distributions."""
-    from imgeda.plotting.pixel_stats import plot_channels
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_channels(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("channels", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -146,11 +161,7 @@ def artifacts(
     seed: int = _seed_opt,
 ) -> None:
     """Plot border artifact analysis."""
-    from imgeda.plotting.artifacts import plot_artifacts
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_artifacts(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("artifacts", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -163,11 +174,7 @@ def duplicates(
     seed: int = _seed_opt,
 ) -> None:
     """Plot duplicate analysis."""
-    from imgeda.plotting.duplicates import plot_duplicates
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_duplicates(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("duplicates", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -180,11 +187,7 @@ def blur(
     seed: int = _seed_opt,
 ) -> None:
     """Plot blur score distribution."""
-    from imgeda.plotting.blur import plot_blur
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_blur(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("blur", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -197,11 +200,7 @@ def exif_camera(
     seed: int = _seed_opt,
 ) -> None:
     """Plot camera make/model distribution."""
-    from imgeda.plotting.exif import plot_camera_distribution
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_camera_distribution(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("exif_camera", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -214,11 +213,7 @@ def exif_focal(
     seed: int = _seed_opt,
 ) -> None:
     """Plot focal length distribution."""
-    from imgeda.plotting.exif import plot_focal_length
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_focal_length(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("exif_focal", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command()
@@ -231,11 +226,7 @@ def exif_iso(
     seed: int = _seed_opt,
 ) -> None:
     """Plot ISO speed distribution."""
-    from imgeda.plotting.exif import plot_iso_distribution
-
-    records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
-    path = plot_iso_distribution(records, config)
-    console.print(f"[green]Saved:[/green] {path}")
+    _run_plot("exif_iso", manifest, output, fmt, dpi, sample, seed)
 
 
 @plot_app.command(name="all")
@@ -248,41 +239,14 @@ def all_plots(
     seed: int = _seed_opt,
 ) -> None:
     """Generate all plots."""
-    from imgeda.plotting.artifacts import plot_artifacts
-    from imgeda.plotting.aspect_ratio import plot_aspect_ratio
-    from imgeda.plotting.blur import plot_blur
-    from imgeda.plotting.dimensions import plot_dimensions
-    from imgeda.plotting.duplicates import plot_duplicates
-    from imgeda.plotting.exif import (
-        plot_camera_distribution,
-        plot_focal_length,
-        plot_iso_distribution,
-    )
-    from imgeda.plotting.file_size import plot_file_size
-    from imgeda.plotting.pixel_stats import plot_brightness, plot_channels
-
     records, config = _load_and_config(manifest, output, fmt, dpi, sample, seed)
 
-    plots = [
-        ("Dimensions", plot_dimensions),
-        ("File size", plot_file_size),
-        ("Aspect ratio", plot_aspect_ratio),
-        ("Brightness", plot_brightness),
-        ("Channels", plot_channels),
-        ("Blur", plot_blur),
-        ("Artifacts", plot_artifacts),
-        ("Duplicates", plot_duplicates),
-        ("Camera distribution", plot_camera_distribution),
-        ("Focal length", plot_focal_length),
-        ("ISO distribution", plot_iso_distribution),
-    ]
     failed: list[str] = []
-    for name, fn in plots:
-        try:
-            path = fn(records, config)
+    for name, path, error in render_plots(records, config):
+        if error is None:
             console.print(f"  [green]{name}:[/green] {path}")
-        except Exception as e:
-            console.print(f"  [red]{name}: Failed — {e}[/red]")
+        else:
+            console.print(f"  [red]{name}: Failed — {error}[/red]")
             failed.append(name)
 
     if failed:
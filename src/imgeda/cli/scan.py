@@ -37,13 +37,14 @@ def scan(
     max_image_dim: int = typer.Option(2048, "--max-image-dim", help="Downsample threshold"),
 ) -> None:
     """Scan a directory of images and produce a JSONL manifest."""
-    from imgeda.pipeline.runner import run_scan
-
+    # Fail fast on a bad path before the pipeline pulls in PIL and numpy
     dir_path = Path(directory)
     if not dir_path.is_dir():
         typer.echo(f"Error: {directory} is not a valid directory", err=True)
         raise typer.Exit(1)
 
+    from imgeda.pipeline.runner import run_scan
+
     config = ScanConfig(
         checkpoint_every=checkpoint_every,
         include_hashes=not no_hashes,
@@ -61,6 +62,7 @@ def scan(
     if workers is not None:
         config.workers = workers
     if extensions:
-        config.extensions = tuple(f".{e.strip().lstrip('.')}" for e in extensions.split(","))
+        names = (e.strip().lstrip(".") for e in extensions.lower().split(","))
+        config.extensions = tuple(f".{name}" for name in names if name)
 
     run_scan(str(dir_path), output, config)
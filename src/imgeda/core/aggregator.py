@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from imgeda.models.manifest import ImageRecord
@@ -35,40 +36,97 @@ class DatasetSummary:
     rotated_count: int = 0
     exif_present_count: int = 0
 
-
-def aggregate(records: list[ImageRecord]) -> DatasetSummary:
-    """Compute dataset-level summary statistics."""
-    if not records:
-        return DatasetSummary()
-
-    valid = [r for r in records if not r.is_corrupt]
-
-    formats: Counter[str] = Counter()
-    modes: Counter[str] = Counter()
-    extensions: Counter[str] = Counter()
-    camera_makes: Counter[str] = Counter()
-    camera_models: Counter[str] = Counter()
-    widths: list[int] = []
-    heights: list[int] = []
-
-    exif_present = 0
-    high_distortion = 0
-    gps_flagged = 0
-    rotated = 0
+    # Records with any quality flag; the preview keeps the first flagged_limit
+    # of them as (path, filename, issues, width, height)
+    flagged_count: int = 0
+    flagged_preview: list[tuple[str, str, str, int, int]] = field(default_factory=list)
+
+    # Non-corrupt records whose phash repeats an earlier one (same count as the
+    # extra members of find_exact_duplicates groups)
+    exact_duplicate_count: int = 0
+
+
+def _ranked(values: Iterable[str]) -> dict[str, int]:
+    """Count values, most common first, ignoring empty strings."""
+    counts = Counter(values)
+    counts.pop("", None)
+    return dict(counts.most_common())
+
+
+_ISSUE_NAMES = ("corrupt", "dark", "overexposed", "blurry", "artifact")
+
+# Issue string for every combination of the five flags, indexed by a bitmask
+# with bit i set when _ISSUE_NAMES[i] applies.
+_ISSUE_STRINGS = tuple(
+    ", ".join(name for i, name in enumerate(_ISSUE_NAMES) if mask >> i & 1)
+    for mask in range(1 << len(_ISSUE_NAMES))
+)
+
+
+def _issues(r: ImageRecord) -> str:
+    """Comma-separated quality issues of a record, in report order."""
+    return _ISSUE_STRINGS[
+        r.is_corrupt
+        | r.is_dark << 1
+        | r.is_overexposed << 2
+        | r.is_blurry << 3
+        | r.has_border_artifact << 4
+    ]
+
+
+def aggregate(records: Iterable[ImageRecord], flagged_limit: int = 0) -> DatasetSummary:
+    """Compute dataset-level summary statistics in a single pass over records.
+
+    Any iterable works, so a manifest can be folded while it is streamed (see
+    iter_manifest) without holding every record in memory. Up to flagged_limit
+    flagged records are collected into flagged_preview in the same pass.
+    """
+    # String fields are gathered per record and tallied by Counter in C at
+    # the end, which is much cheaper than a Counter increment per record.
+    formats: list[str] = []
+    modes: list[str] = []
+    extensions: list[str] = []
+    camera_makes: list[str] = []
+    camera_models: list[str] = []
+
+    flagged_preview: list[tuple[str, str, str, int, int]] = []
+    phashes: list[str] = []
+
+    total_size = 0
+    corrupt = dark = overexposed = artifact = blurry = flagged = 0
+    high_distortion = gps_flagged = rotated = 0
+    # Dimension bounds cover non-corrupt records only
+    have_dims = False
+    min_w = max_w = min_h = max_h = 0
 
     for r in records:
-        if r.format:
-            formats[r.format] += 1
-        if r.color_mode:
-            modes[r.color_mode] += 1
-        ext = r.filename.rsplit(".", 1)[-1].lower() if "." in r.filename else ""
-        if ext:
-            extensions[ext] += 1
+        total_size += r.file_size_bytes
+        is_flagged = r.is_corrupt
+        if r.is_dark:
+            dark += 1
+            is_flagged = True
+        if r.is_overexposed:
+            overexposed += 1
+            is_flagged = True
+        if r.has_border_artifact:
+            artifact += 1
+            is_flagged = True
+        if r.is_blurry:
+            blurry += 1
+            is_flagged = True
+        if is_flagged:
+            flagged += 1
+            if len(flagged_preview) < flagged_limit:
+                flagged_preview.append((r.path, r.filename, _issues(r), r.width, r.height))
+        formats.append(r.format)
+        modes.append(r.color_mode)
+        filename = r.filename
+        if "." in filename:
+            extensions.append(filename.rsplit(".", 1)[-1])
         if r.camera_make:
-            camera_makes[r.camera_make] += 1
-            exif_present += 1
+            camera_makes.append(r.camera_make)
         if r.camera_model:
-            camera_models[r.camera_model] += 1
+            camera_models.append(r.camera_model)
         if r.distortion_risk == "high":
             high_distortion += 1
         if r.has_gps_data:
@@ -76,29 +134,49 @@ def aggregate(records: list[ImageRecord]) -> DatasetSummary:
         if r.orientation_tag is not None and r.orientation_tag != 1:
             rotated += 1
 
-    for r in valid:
-        widths.append(r.width)
-        heights.append(r.height)
+        if r.is_corrupt:
+            corrupt += 1
+            continue
+        if r.phash:
+            phashes.append(r.phash)
+        w = r.width
+        h = r.height
+        if not have_dims:
+            min_w = max_w = w
+            min_h = max_h = h
+            have_dims = True
+            continue
+        if w < min_w:
+            min_w = w
+        elif w > max_w:
+            max_w = w
+        if h < min_h:
+            min_h = h
+        elif h > max_h:
+            max_h = h
 
     return DatasetSummary(
-        total_images=len(records),
-        total_size_bytes=sum(r.file_size_bytes for r in records),
-        corrupt_count=sum(1 for r in records if r.is_corrupt),
-        dark_count=sum(1 for r in records if r.is_dark),
-        overexposed_count=sum(1 for r in records if r.is_overexposed),
-        artifact_count=sum(1 for r in records if r.has_border_artifact),
-        blurry_count=sum(1 for r in records if r.is_blurry),
-        min_width=min(widths) if widths else 0,
-        max_width=max(widths) if widths else 0,
-        min_height=min(heights) if heights else 0,
-        max_height=max(heights) if heights else 0,
-        format_counts=dict(formats.most_common()),
-        mode_counts=dict(modes.most_common()),
-        extension_counts=dict(extensions.most_common()),
-        camera_make_counts=dict(camera_makes.most_common()),
-        camera_model_counts=dict(camera_models.most_common()),
+        total_images=len(formats),  # one entry per record
+        total_size_bytes=total_size,
+        corrupt_count=corrupt,
+        dark_count=dark,
+        overexposed_count=overexposed,
+        artifact_count=artifact,
+        blurry_count=blurry,
+        min_width=min_w,
+        max_width=max_w,
+        min_height=min_h,
+        max_height=max_h,
+        format_counts=_ranked(formats),
+        mode_counts=_ranked(modes),
+        extension_counts=_ranked(ext.lower() for ext in extensions),
+        camera_make_counts=_ranked(camera_makes),
+        camera_model_counts=_ranked(camera_models),
         high_distortion_risk_count=high_distortion,
         gps_flagged_count=gps_flagged,
         rotated_count=rotated,
-        exif_present_count=exif_present,
+        exif_present_count=len(camera_makes),
+        flagged_count=flagged,
+        flagged_preview=flagged_preview,
+        exact_duplicate_count=len(phashes) - len(set(phashes)),
     )
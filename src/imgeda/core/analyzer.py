@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import io
 import os
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Any
 
@@ -19,7 +21,7 @@ from imgeda.core.detector import (
 )
 from imgeda.core.hasher import compute_dhash, compute_phash
 from imgeda.models.config import ScanConfig
-from imgeda.models.manifest import ImageRecord
+from imgeda.models.manifest import CornerStats, ImageRecord
 
 # EXIF tag IDs (numeric to avoid dependency on PIL.ExifTags enum names)
 _EXIF_MAKE = 0x010F  # 271 — Camera manufacturer
@@ -144,12 +146,16 @@ def analyze_image(path: str, config: ScanConfig) -> ImageRecord:
         record.is_corrupt = True
         return record
 
-    # Step 2: Open and verify image
+    # Step 2: Open and verify image. The file is read from disk once; verify()
+    # catches damage that decoding tolerates (e.g. PNG chunk CRC errors), then
+    # the image is reopened from the same buffer, still lazy so draft() works.
     try:
-        img = Image.open(path)
-        img.verify()
-        # Re-open after verify (verify closes the file)
-        img = Image.open(path)
+        with open(path, "rb") as f:
+            buf = io.BytesIO(f.read())
+        with Image.open(buf) as probe:
+            probe.verify()
+        buf.seek(0)
+        img = Image.open(buf)
     except Exception:
         record.is_corrupt = True
         return record
@@ -169,34 +175,59 @@ def analyze_image(path: str, config: ScanConfig) -> ImageRecord:
             except Exception:
                 pass  # EXIF extraction failure is non-fatal
 
+        max_dim = config.max_image_dimension
+        new_size: tuple[int, int] | None = None
+        if img.width > max_dim or img.height > max_dim:
+            ratio = max_dim / max(img.width, img.height)
+            new_size = (int(img.width * ratio), int(img.height * ratio))
+            # JPEG can decode at 1/2, 1/4 or 1/8 scale directly; draft() picks
+            # the smallest scale that still covers new_size, so LANCZOS below
+            # only finishes the last step instead of shrinking the full image
+            if img.format in ("JPEG", "MPO"):
+                img.draft("RGB", new_size)
+
         # Convert to RGB for analysis
         rgb = img.convert("RGB")
 
-        # Downsample if too large
-        max_dim = config.max_image_dimension
-        if rgb.width > max_dim or rgb.height > max_dim:
-            ratio = max_dim / max(rgb.width, rgb.height)
-            new_size = (int(rgb.width * ratio), int(rgb.height * ratio))
-            rgb = rgb.resize(new_size, Image.Resampling.LANCZOS)
+        # Downsample if too large. With reducing_gap, shrinks of 6x or more
+        # first box-reduce by an integer factor, leaving LANCZOS at least 3x
+        if new_size is not None and rgb.size != new_size:
+            rgb = rgb.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
 
-        pixels = np.array(rgb, dtype=np.uint8)
+        # Read-only view of the decoded bytes; nothing below writes to pixels,
+        # so the extra copy np.array() would make is skipped
+        pixels = np.asarray(rgb)
 
         # Step 4: Pixel stats
+        uniform_value: float | None = None
         if not config.skip_pixel_stats:
-            record.pixel_stats = compute_pixel_stats(pixels)
-            record.is_dark = is_dark(record.pixel_stats, config.dark_threshold)
-            record.is_overexposed = is_overexposed(record.pixel_stats, config.overexposed_threshold)
+            pixel_stats = compute_pixel_stats(pixels)
+            record.pixel_stats = pixel_stats
+            record.is_dark = is_dark(pixel_stats, config.dark_threshold)
+            record.is_overexposed = is_overexposed(pixel_stats, config.overexposed_threshold)
+            # A single value everywhere (blank frames, solid fills) fixes every
+            # region mean and a zero Laplacian, so steps 5 and 6 need no pixels
+            if pixel_stats.min_val == pixel_stats.max_val:
+                uniform_value = float(pixel_stats.min_val)
 
         # Step 5: Corner stats
         if not config.skip_pixel_stats:
-            record.corner_stats = compute_corner_stats(pixels, config.corner_patch_fraction)
+            if uniform_value is not None:
+                record.corner_stats = CornerStats(
+                    corner_mean=uniform_value,
+                    center_mean=uniform_value,
+                    border_mean=uniform_value,
+                    delta=0.0,
+                )
+            else:
+                record.corner_stats = compute_corner_stats(pixels, config.corner_patch_fraction)
             record.has_border_artifact = has_border_artifact(
                 record.corner_stats, config.artifact_threshold
             )
 
         # Step 6: Blur detection
         if not config.skip_blur and not config.skip_pixel_stats:
-            score = compute_blur_score(pixels)
+            score = 0.0 if uniform_value is not None else compute_blur_score(pixels)
             record.blur_score = round(score, 2)
             record.is_blurry = score < config.blur_threshold
 
@@ -209,3 +240,13 @@ def analyze_image(path: str, config: ScanConfig) -> ImageRecord:
         record.is_corrupt = True
 
     return record
+
+
+def analyze_images(paths: Sequence[str], config: ScanConfig) -> list[ImageRecord]:
+    """Analyze several images in order.
+
+    The scan pipeline submits paths to its process pool in chunks through this,
+    so the config and the result list cross the process boundary once per chunk
+    rather than once per image.
+    """
+    return [analyze_image(path, config) for path in paths]
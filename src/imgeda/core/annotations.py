@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import json
 import os
-import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from itertools import combinations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+# libxml2-backed parser when available; the stdlib parser exposes the same API.
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 
 @dataclass(slots=True)
 class BBox:
@@ -95,28 +103,28 @@ def _parse_yolo_labels(
     """
     annotations: dict[str, list[BBox]] = {}
     errors: list[str] = []
+    n_names = len(class_names)
 
     for txt_file in Path(label_dir).glob("*.txt"):
         stem = txt_file.stem
         boxes: list[BBox] = []
         try:
-            for line in txt_file.read_text().strip().splitlines():
-                parts = line.strip().split()
+            # split() without arguments already drops surrounding whitespace
+            for line in txt_file.read_text().splitlines():
+                parts = line.split()
                 if len(parts) < 5:
                     continue
                 cls_id = int(parts[0])
-                xc, yc, w, h = float(parts[1]), float(parts[2]), float(parts[3]), float(parts[4])
-                cls_name = class_names[cls_id] if cls_id < len(class_names) else str(cls_id)
-                area = w * h
+                xc, yc, w, h = map(float, parts[1:5])
                 boxes.append(
                     BBox(
-                        class_name=cls_name,
+                        class_name=class_names[cls_id] if cls_id < n_names else str(cls_id),
                         class_id=cls_id,
                         x_center=xc,
                         y_center=yc,
                         width=w,
                         height=h,
-                        area=area,
+                        area=w * h,
                     )
                 )
         except Exception:
@@ -198,7 +206,7 @@ def _parse_voc_annotations(
 
     for xml_file in Path(annotation_dir).glob("*.xml"):
         try:
-            tree = ET.parse(xml_file)
+            tree = ET.parse(str(xml_file))
             root = tree.getroot()
 
             fname_el = root.find("filename")
@@ -300,39 +308,33 @@ def analyze_annotations(
     if not annotations:
         return stats
 
-    # Compute stats
-    all_classes: Counter[str] = Counter()
-    co_occur: dict[str, Counter[str]] = defaultdict(Counter)
-
-    for stem, boxes in annotations.items():
-        stats.objects_per_image.append(len(boxes))
-
-        classes_in_image: set[str] = set()
-        for box in boxes:
-            all_classes[box.class_name] += 1
-            stats.bbox_widths.append(box.width)
-            stats.bbox_heights.append(box.height)
-            stats.bbox_areas.append(box.area)
-            if box.height > 0:
-                stats.bbox_aspect_ratios.append(box.width / box.height)
-            stats.bbox_x_centers.append(box.x_center)
-            stats.bbox_y_centers.append(box.y_center)
-
-            # Size classification
-            if box.area < 0.01:
-                stats.small_count += 1
-            elif box.area < 0.1:
-                stats.medium_count += 1
-            else:
-                stats.large_count += 1
-
-            classes_in_image.add(box.class_name)
-
-        # Co-occurrence
-        for c1 in classes_in_image:
-            for c2 in classes_in_image:
-                if c1 != c2:
-                    co_occur[c1][c2] += 1
+    # Compute stats. Box attributes are gathered column by column over one flat
+    # list of boxes rather than appended to six lists per box.
+    all_boxes = [box for boxes in annotations.values() for box in boxes]
+    all_classes: Counter[str] = Counter(box.class_name for box in all_boxes)
+    stats.objects_per_image = [len(boxes) for boxes in annotations.values()]
+    stats.bbox_widths = [box.width for box in all_boxes]
+    stats.bbox_heights = [box.height for box in all_boxes]
+    stats.bbox_areas = [box.area for box in all_boxes]
+    stats.bbox_aspect_ratios = [box.width / box.height for box in all_boxes if box.height > 0]
+    stats.bbox_x_centers = [box.x_center for box in all_boxes]
+    stats.bbox_y_centers = [box.y_center for box in all_boxes]
+
+    # Size classification
+    areas = np.asarray(stats.bbox_areas, dtype=np.float64)
+    stats.small_count = int(np.count_nonzero(areas < 0.01))
+    stats.medium_count = int(np.count_nonzero(areas < 0.1)) - stats.small_count
+    stats.large_count = len(all_boxes) - stats.small_count - stats.medium_count
+
+    # Co-occurrence: count each unordered class pair once per image, then
+    # mirror into the symmetric nested mapping
+    pair_counts: Counter[tuple[str, str]] = Counter()
+    for boxes in annotations.values():
+        pair_counts.update(combinations(sorted({box.class_name for box in boxes}), 2))
+    co_occur: dict[str, dict[str, int]] = defaultdict(dict)
+    for (c1, c2), n in pair_counts.items():
+        co_occur[c1][c2] = n
+        co_occur[c2][c1] = n
 
     stats.total_annotations = sum(all_classes.values())
     stats.class_counts = dict(all_classes.most_common())
@@ -352,15 +354,19 @@ def analyze_annotations(
         stats.max_objects_per_image = max(stats.objects_per_image)
 
     # Co-occurrence matrix
-    stats.co_occurrence = {k: dict(v) for k, v in co_occur.items()}
+    stats.co_occurrence = dict(co_occur)
 
     # Orphan annotation detection (annotations without matching images)
     if image_dir and os.path.isdir(image_dir):
-        img_exts = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".webp", ".gif"}
+        img_exts = {"jpg", "jpeg", "png", "bmp", "tiff", "tif", "webp", "gif"}
         image_stems = set()
-        for f in os.listdir(image_dir):
-            if os.path.splitext(f)[1].lower() in img_exts:
-                image_stems.add(os.path.splitext(f)[0])
+        with os.scandir(image_dir) as entries:
+            for entry in entries:
+                # Same split as os.path.splitext, which gives dotfiles such as
+                # ".png" no extension
+                stem, _, ext = entry.name.rpartition(".")
+                if ext.lower() in img_exts and stem.lstrip("."):
+                    image_stems.add(stem)
 
         ann_stems = set(annotations.keys())
         stats.orphan_annotations = sorted(ann_stems - image_stems)[:100]
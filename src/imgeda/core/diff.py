@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import asdict, dataclass, field
+from operator import attrgetter
 
 from imgeda.models.manifest import ImageRecord
 
@@ -65,6 +67,13 @@ _COMPARE_FIELDS = (
     "has_border_artifact",
     "phash",
 )
+_compare_values = attrgetter(*_COMPARE_FIELDS)
+
+
+def _count_dup_groups(records: list[ImageRecord]) -> int:
+    """Number of exact-phash duplicate groups, as len(find_exact_duplicates(records))."""
+    counts = Counter(r.phash for r in records if r.phash and not r.is_corrupt)
+    return sum(1 for n in counts.values() if n > 1)
 
 
 def diff_manifests(
@@ -86,26 +95,23 @@ def diff_manifests(
     unchanged_count = 0
 
     for path in sorted(common):
-        old_rec = old_by_path[path]
-        new_rec = new_by_path[path]
-        diffs: dict[str, tuple[object, object]] = {}
-
-        for fld in _COMPARE_FIELDS:
-            old_val = getattr(old_rec, fld)
-            new_val = getattr(new_rec, fld)
-            if old_val != new_val:
-                diffs[fld] = (old_val, new_val)
-
-        if diffs:
-            changed.append(ChangedRecord(path=path, fields=diffs))
-        else:
+        # One C-level tuple per record; the common unchanged case is a single
+        # tuple comparison
+        old_vals = _compare_values(old_by_path[path])
+        new_vals = _compare_values(new_by_path[path])
+        if old_vals == new_vals:
             unchanged_count += 1
+            continue
 
-    # Compute duplicate group counts
-    from imgeda.core.duplicates import find_exact_duplicates
+        diffs: dict[str, tuple[object, object]] = {
+            fld: (old_val, new_val)
+            for fld, old_val, new_val in zip(_COMPARE_FIELDS, old_vals, new_vals)
+            if old_val != new_val
+        }
+        changed.append(ChangedRecord(path=path, fields=diffs))
 
-    dup_old = len(find_exact_duplicates(old_records))
-    dup_new = len(find_exact_duplicates(new_records))
+    dup_old = _count_dup_groups(old_records)
+    dup_new = _count_dup_groups(new_records)
 
     summary = DiffSummary(
         total_old=len(old_records),
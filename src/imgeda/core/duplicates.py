@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from itertools import combinations
 
-from imgeda.core.hasher import hamming_distance
 from imgeda.models.manifest import ImageRecord
 
 # Skip buckets larger than this to avoid O(n^2) blowup on hot sub-hashes
@@ -35,44 +35,47 @@ def find_near_duplicates(
     if not hashable:
         return []
 
-    # Build sub-hash buckets (4 quarters of the hex string)
-    buckets: dict[str, list[int]] = defaultdict(list)
+    # Build sub-hash buckets (4 quarters of the hex string), one table per
+    # quarter so the slice itself is the key
+    quarters: list[defaultdict[str, list[int]]] = [defaultdict(list) for _ in range(4)]
     for idx, (_, phash) in enumerate(hashable):
         chunk_size = max(1, len(phash) // 4)
-        for i in range(4):
-            sub = phash[i * chunk_size : (i + 1) * chunk_size]
-            buckets[f"{i}:{sub}"].append(idx)
+        for i, buckets in enumerate(quarters):
+            buckets[phash[i * chunk_size : (i + 1) * chunk_size]].append(idx)
+
+    # Hex hashes as integers: Hamming distance is the popcount of their XOR
+    values = [int(phash, 16) for _, phash in hashable]
 
     # Find candidate pairs within buckets
     pairs: set[tuple[int, int]] = set()
-    for indices in buckets.values():
+    for indices in (ix for buckets in quarters for ix in buckets.values()):
         if len(indices) < 2 or len(indices) > _MAX_BUCKET_SIZE:
             continue
-        for i in range(len(indices)):
-            for j in range(i + 1, len(indices)):
-                a, b = indices[i], indices[j]
-                pair = (min(a, b), max(a, b))
-                if pair not in pairs:
-                    dist = hamming_distance(hashable[a][1], hashable[b][1])
-                    if dist <= hamming_threshold:
-                        pairs.add(pair)
-
-    # Union-find to cluster connected pairs
-    parent: dict[int, int] = {}
+        # Indices were appended in ascending order, so every pair is (low, high)
+        for pair in combinations(indices, 2):
+            a, b = pair
+            if pair not in pairs and (values[a] ^ values[b]).bit_count() <= hamming_threshold:
+                pairs.add(pair)
+
+    # Union-find over record indices: full path compression, union by size
+    parent = list(range(len(hashable)))
+    size = [1] * len(hashable)
 
     def find(x: int) -> int:
-        while parent.get(x, x) != x:
-            parent[x] = parent.get(parent[x], parent[x])
-            x = parent[x]
-        return x
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
 
-    def union(a: int, b: int) -> None:
+    for a, b in pairs:
         ra, rb = find(a), find(b)
         if ra != rb:
-            parent[ra] = rb
-
-    for a, b in pairs:
-        union(a, b)
+            if size[ra] < size[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            size[ra] += size[rb]
 
     # Group by root
     clusters: dict[int, list[int]] = defaultdict(list)
@@ -5,11 +5,16 @@ Requires: pip install imgeda[embeddings]
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from typing import Any
 
 import numpy as np
+import orjson
 from numpy.typing import NDArray
 
+from imgeda.io.json_io import write_json
+
 
 def _check_deps() -> None:
     """Check that embedding dependencies are available."""
@@ -24,6 +29,46 @@ def _check_deps() -> None:
         raise ImportError(msg) from e
 
 
+class _ImageDataset:
+    """Map-style dataset that decodes and preprocesses one image per index.
+
+    Kept at module level (not a torch Dataset subclass) so DataLoader workers
+    can pickle it under spawn without importing torch at module import.
+    """
+
+    def __init__(self, paths: list[str], preprocess: Any) -> None:
+        self.paths = paths
+        self.preprocess = preprocess
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> Any:
+        import torch
+        from PIL import Image
+
+        try:
+            with Image.open(self.paths[index]) as img:
+                return self.preprocess(img.convert("RGB"))
+        except Exception:
+            # Use zero vector for unreadable images
+            return torch.zeros(3, 224, 224)
+
+
+def _default_num_workers(n_images: int, batch_size: int, device: str) -> int:
+    """DataLoader workers to use when the caller does not choose.
+
+    Workers only pay off when decoding overlaps GPU inference across several
+    batches; each one is a new process (spawned, re-importing torch, on macOS
+    and Windows), so CPU runs and single-batch inputs decode in-process. On
+    CUDA this is half the CPUs, capped at 8 and at the number of batches.
+    """
+    if not device.startswith("cuda") or n_images <= batch_size:
+        return 0
+    n_batches = -(-n_images // batch_size)
+    return min(8, (os.cpu_count() or 1) // 2, n_batches)
+
+
 def compute_embeddings(
     image_paths: list[str],
     model_name: str = "ViT-B-32",
@@ -31,6 +76,7 @@ def compute_embeddings(
     batch_size: int = 32,
     device: str | None = None,
     progress_callback: Any = None,
+    num_workers: int | None = None,
 ) -> NDArray[np.float32]:
     """Compute CLIP embeddings for a list of images.
 
@@ -41,6 +87,8 @@ def compute_embeddings(
         batch_size: Batch size for inference
         device: Torch device ('cuda', 'cpu', 'mps'). Auto-detected if None.
         progress_callback: Optional callable(current, total) for progress updates
+        num_workers: DataLoader worker processes decoding images while the model
+            runs; 0 decodes in-process. Defaults to _default_num_workers().
 
     Returns:
         (N, D) numpy array of normalized embeddings
@@ -49,7 +97,7 @@ def compute_embeddings(
 
     import torch
     import open_clip
-    from PIL import Image
+    from torch.utils.data import DataLoader
 
     # Auto-detect device
     if device is None:
@@ -65,29 +113,53 @@ def compute_embeddings(
     )
     model.eval()
 
-    all_embeddings: list[NDArray[np.float32]] = []
-
-    for start in range(0, len(image_paths), batch_size):
-        batch_paths = image_paths[start : start + batch_size]
-        images = []
-        for p in batch_paths:
-            try:
-                img = Image.open(p).convert("RGB")
-                images.append(preprocess(img))
-            except Exception:
-                # Use zero vector for unreadable images
-                images.append(torch.zeros(3, 224, 224))
-
-        batch_tensor = torch.stack(images).to(device)
+    if num_workers is None:
+        num_workers = _default_num_workers(len(image_paths), batch_size, device)
+    # Decode and preprocess in worker processes so the next batch is ready
+    # while the current one is on the model; pinned buffers let the host to
+    # device copy run asynchronously.
+    loader = DataLoader(
+        _ImageDataset(image_paths, preprocess),
+        batch_size=batch_size,
+        num_workers=num_workers,
+        pin_memory=device.startswith("cuda"),
+    )
 
-        with torch.no_grad():
-            features = model.encode_image(batch_tensor)
-            features = features / features.norm(dim=-1, keepdim=True)
+    # On CUDA, fp32 matmuls may use TF32 tensor cores and the encoder runs under
+    # autocast (bf16 where supported, else fp16). Features are normalized in
+    # fp32 either way, so the returned embeddings keep their dtype.
+    use_amp = device.startswith("cuda")
+    amp_dtype = torch.bfloat16
+    if use_amp and not torch.cuda.is_bf16_supported():
+        amp_dtype = torch.float16
+    matmul_precision = torch.get_float32_matmul_precision()
+    if use_amp:
+        torch.set_float32_matmul_precision("high")
 
-        all_embeddings.append(features.cpu().numpy().astype(np.float32))
+    all_embeddings: list[NDArray[np.float32]] = []
+    done = 0
 
-        if progress_callback:
-            progress_callback(min(start + batch_size, len(image_paths)), len(image_paths))
+    try:
+        for batch in loader:
+            batch_tensor = batch.to(device, non_blocking=True)
+
+            with torch.inference_mode():
+                with torch.autocast("cuda" if use_amp else "cpu", dtype=amp_dtype, enabled=use_amp):
+                    features = model.encode_image(batch_tensor)
+                features = torch.nn.functional.normalize(features.float(), dim=-1)
+                all_embeddings.append(features.cpu().numpy())
+            # Let the caching allocator reuse these blocks for the next batch
+            del batch_tensor, features
+
+            done += len(batch)
+            if progress_callback:
+                progress_callback(done, len(image_paths))
+    finally:
+        torch.set_float32_matmul_precision(matmul_precision)
+        # The model is built per call; hand its cached GPU memory back on return
+        del model
+        if device.startswith("cuda"):
+            torch.cuda.empty_cache()
 
     return np.concatenate(all_embeddings, axis=0)
 
@@ -156,22 +228,69 @@ def find_semantic_duplicates(
         for j in range(i, n, chunk_size):
             other = embeddings[j : j + chunk_size]
             sims = chunk @ other.T
-
-            for ci in range(len(chunk)):
-                start_cj = ci + 1 if i == j else 0
-                for cj in range(start_cj, len(other)):
-                    if sims[ci, cj] >= threshold:
-                        duplicates.append((i + ci, j + cj, float(sims[ci, cj])))
+            hits = sims >= threshold
+            if i == j:
+                hits = np.triu(hits, k=1)
+            rows, cols = np.nonzero(hits)
+            duplicates.extend(
+                zip(
+                    (rows + i).tolist(),
+                    (cols + j).tolist(),
+                    sims[rows, cols].tolist(),
+                )
+            )
 
     return duplicates
 
 
+def quantize_int8(
+    embeddings: NDArray[np.float32],
+) -> tuple[NDArray[np.int8], NDArray[np.float32]]:
+    """Quantize embeddings to int8 with one scale per row.
+
+    Each row is scaled so its largest magnitude maps to 127; multiplying the
+    int8 row by its scale recovers the embedding to within half a step.
+
+    Returns:
+        (int8 embeddings, float32 per-row scales)
+    """
+    peak = np.abs(embeddings).max(axis=1, initial=0.0)
+    scales = (peak / 127.0).astype(np.float32)
+    safe = np.where(scales > 0, scales, 1.0)[:, None]
+    quantized = np.rint(embeddings / safe).astype(np.int8)
+    return quantized, scales
+
+
+def _paths_sidecar(npy_path: str) -> str:
+    """JSON file holding the image paths for an uncompressed .npy embeddings file."""
+    return npy_path[: -len(".npy")] + ".paths.json"
+
+
 def save_embeddings(
     embeddings: NDArray[np.float32],
     paths: list[str],
     output_path: str,
+    quantize: bool = False,
 ) -> None:
-    """Save embeddings alongside manifest as .npz file."""
+    """Save embeddings alongside manifest as .npz file.
+
+    With quantize=True the embeddings are stored as int8 plus per-row scales,
+    a quarter of the float32 size. load_embeddings restores them to float32.
+
+    An output path ending in .npy is instead written as an uncompressed float32
+    array with the paths in a `<name>.paths.json` sidecar, which
+    load_embeddings memory-maps rather than reading into RAM.
+    """
+    if output_path.endswith(".npy"):
+        if quantize:
+            raise ValueError("int8 quantization requires .npz output")
+        np.save(output_path, np.asarray(embeddings, dtype=np.float32))
+        write_json(_paths_sidecar(output_path), paths, compact=True)
+        return
+    if quantize:
+        quantized, scales = quantize_int8(embeddings)
+        np.savez_compressed(output_path, embeddings=quantized, scales=scales, paths=np.array(paths))
+        return
     np.savez_compressed(
         output_path,
         embeddings=embeddings,
@@ -180,6 +299,16 @@ def save_embeddings(
 
 
 def load_embeddings(path: str) -> tuple[NDArray[np.float32], list[str]]:
-    """Load embeddings from .npz file."""
+    """Load embeddings from .npz file, dequantizing int8 files to float32.
+
+    .npy files are opened read-only with mmap_mode="r", so chunked consumers
+    such as find_semantic_duplicates page rows in from disk as they go.
+    """
+    if path.endswith(".npy"):
+        paths: list[str] = orjson.loads(Path(_paths_sidecar(path)).read_bytes())
+        return np.load(path, mmap_mode="r"), paths
     data = np.load(path)
-    return data["embeddings"], data["paths"].tolist()
+    embeddings = data["embeddings"]
+    if "scales" in data:
+        embeddings = embeddings.astype(np.float32) * data["scales"][:, None]
+    return embeddings, data["paths"].tolist()
@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import math
 import os
-from dataclasses import dataclass, field
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".webp", ".gif"}
+_IMAGE_EXTENSIONS_NO_DOT = frozenset(ext[1:] for ext in IMAGE_EXTENSIONS)
+
+# Threads used to scan sibling directories (splits, class folders) concurrently
+_SCAN_THREADS = 4
+
+# Files whose sizes are sampled to estimate a tree's total size
+_SIZE_SAMPLE_LIMIT = 100
+
+# Per-detection memo of tree scans: directory -> (image count, size estimate)
+_TreeScans = dict[str, tuple[int, int]]
+
+# Keep the on-disk detection cache bounded; oldest entries are evicted first
+_CACHE_MAX_ENTRIES = 128
 
 
 @dataclass(slots=True)
@@ -30,75 +51,260 @@ def detect_format(root: str) -> DatasetInfo:
 
     Checks in order: YOLO, COCO, Pascal VOC, Classification, Flat (fallback).
     """
-    root_path = Path(root)
+    # Tree scans are shared between detectors only within this detection
+    return _detect(Path(root), {})
+
 
+def _detect(root_path: Path, scans: _TreeScans) -> DatasetInfo:
     # 1. YOLO — data.yaml at root
-    info = _try_yolo(root_path)
+    info = _try_yolo(root_path, scans)
     if info is not None:
         return info
 
     # 2. COCO — annotations/*.json with COCO keys
-    info = _try_coco(root_path)
+    info = _try_coco(root_path, scans)
     if info is not None:
         return info
 
     # 3. Pascal VOC — Annotations/ + JPEGImages/
-    info = _try_voc(root_path)
+    info = _try_voc(root_path, scans)
     if info is not None:
         return info
 
     # 4. Classification — >3 subdirs each containing images
-    info = _try_classification(root_path)
+    info = _try_classification(root_path, scans)
     if info is not None:
         return info
 
     # 5. Flat fallback
-    return _build_flat(root_path)
+    return _build_flat(root_path, scans)
 
 
-def _count_images_in(directory: Path) -> int:
-    """Count image files recursively under a directory."""
-    count = 0
-    if not directory.is_dir():
-        return 0
-    for dirpath, _dirnames, filenames in os.walk(directory):
-        for fn in filenames:
-            if Path(fn).suffix.lower() in IMAGE_EXTENSIONS:
-                count += 1
-    return count
-
-
-def _estimate_size(directory: Path, sample_limit: int = 100) -> int:
-    """Estimate total image size by sampling up to sample_limit files."""
+def detect_format_cached(root: str, cache_path: str | Path | None = None) -> DatasetInfo:
+    """detect_format() backed by a small persistent cache.
+
+    Entries are keyed by the resolved directory and invalidated when its
+    fingerprint changes: the top-level structure, the files detection parses
+    and the detected image directories (see _fingerprint). The cache lives in
+    $XDG_CACHE_HOME/imgeda (default ~/.cache/imgeda); any problem reading or
+    writing it falls back to a fresh detection.
+    """
+    key = str(Path(root).resolve())
+    cache_file = Path(cache_path) if cache_path is not None else _default_cache_path()
+    cache = _load_cache(cache_file)
+    entry = cache.get(key)
+    if isinstance(entry, dict):
+        try:
+            info = DatasetInfo(**entry["info"])
+            if entry.get("fingerprint") == _fingerprint(key, info.image_dirs):
+                return info
+        except (KeyError, TypeError, OSError):
+            pass
+
+    info = detect_format(root)
+    try:
+        fingerprint = _fingerprint(key, info.image_dirs)
+    except OSError:
+        return info
+    cache.pop(key, None)
+    cache[key] = {"fingerprint": fingerprint, "info": asdict(info)}
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    _save_cache(cache_file, cache)
+    return info
+
+
+def _default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "imgeda" / "format_cache.json"
+
+
+def _fingerprint(root: str, image_dirs: list[str]) -> str:
+    """Hash everything detection depends on, cheaply enough to run per lookup.
+
+    Covers the directory's mtime, its top-level entries (names + dir mtimes),
+    the mtime and size of each file detection parses (data.yaml,
+    annotations/*.json, ImageSets/Main/*.txt), and the mtimes of the detected
+    image directories. So adding a split, editing class names in place or
+    adding images to images/train all invalidate the entry; changes deeper in
+    the tree only affect image counts, which are estimates anyway.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(os.stat(root).st_mtime_ns).encode())
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        h.update(entry.name.encode("utf-8", "surrogateescape"))
+        if entry.is_dir():
+            h.update(str(entry.stat().st_mtime_ns).encode())
+        h.update(b"\0")
+
+    inputs = [os.path.join(root, "data.yaml")]
+    for subdir, suffix in (("annotations", ".json"), (os.path.join("ImageSets", "Main"), ".txt")):
+        try:
+            with os.scandir(os.path.join(root, subdir)) as it:
+                inputs.extend(sorted(e.path for e in it if e.name.endswith(suffix)))
+        except OSError:
+            pass
+    for path in (*inputs, *image_dirs):
+        h.update(path.encode("utf-8", "surrogateescape"))
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            h.update(b"-\0")
+            continue
+        h.update(f"{st.st_mtime_ns}:{st.st_size}\0".encode())
+    return h.hexdigest()
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_cache(path: Path, cache: dict[str, Any]) -> None:
+    """Write the cache atomically; failures are ignored (the cache is best-effort)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(cache))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _iter_image_entries(directory: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Yield image file entries under directory in os.walk (top-down) order.
+
+    Uses os.scandir directly so each entry is classified from its dirent, and
+    matches extensions on the name string without building a Path per file.
+    Symlinked directories are not descended into, as with os.walk.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs: list[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+            continue
+        stem, _, ext = entry.name.rpartition(".")
+        if stem and ext.lower() in _IMAGE_EXTENSIONS_NO_DOT:
+            yield entry
+    for subdir in subdirs:
+        yield from _iter_image_entries(subdir)
+
+
+def _scan_tree(directory: Path, scans: _TreeScans) -> tuple[int, int]:
+    """Count images under directory and estimate their total size in one walk.
+
+    The size estimate scales the mean of the first _SIZE_SAMPLE_LIMIT file
+    sizes to the full count. Results are recorded in scans, the memo of the
+    current detect_format call, so a directory both counted and sized, or
+    probed by several detectors, is walked once.
+    """
+    key = str(directory)
+    if key in scans:
+        return scans[key]
     sizes: list[int] = []
     total_images = 0
-    for dirpath, _dirnames, filenames in os.walk(directory):
-        for fn in filenames:
-            if Path(fn).suffix.lower() in IMAGE_EXTENSIONS:
-                total_images += 1
-                if len(sizes) < sample_limit:
-                    try:
-                        sizes.append(os.path.getsize(os.path.join(dirpath, fn)))
-                    except OSError:
-                        pass
-    if not sizes:
-        return 0
-    avg = sum(sizes) / len(sizes)
-    return int(avg * total_images)
+    for entry in _iter_image_entries(key):
+        total_images += 1
+        if len(sizes) < _SIZE_SAMPLE_LIMIT:
+            try:
+                sizes.append(entry.stat().st_size)
+            except OSError:
+                pass
+    estimate = int(sum(sizes) / len(sizes) * total_images) if sizes else 0
+    scans[key] = (total_images, estimate)
+    return scans[key]
+
+
+def _count_images_in(directory: Path, scans: _TreeScans) -> int:
+    """Count image files recursively under a directory."""
+    return _scan_tree(directory, scans)[0]
+
+
+def _has_any_image(directory: Path) -> bool:
+    """Whether directory holds at least one image; stops at the first one."""
+    return next(_iter_image_entries(directory), None) is not None
+
+
+def _count_images_each(directories: list[Path], scans: _TreeScans) -> list[int]:
+    """_count_images_in for several directories, scanned concurrently.
+
+    Directory scans are syscall-bound and release the GIL, so a few threads
+    overlap the dirent reads (most useful on network mounts).
+    """
+    if len(directories) <= 1:
+        return [_count_images_in(d, scans) for d in directories]
+    with ThreadPoolExecutor(max_workers=min(_SCAN_THREADS, len(directories))) as pool:
+        return list(pool.map(lambda d: _count_images_in(d, scans), directories))
+
+
+def _estimate_size(directory: Path, scans: _TreeScans) -> int:
+    """Estimate total image size by sampling up to _SIZE_SAMPLE_LIMIT files."""
+    return _scan_tree(directory, scans)[1]
 
 
 def _parse_simple_yaml(path: Path) -> dict[str, str | list[str]]:
-    """Parse a simple YAML file without pyyaml dependency.
+    """Read a YOLO data.yaml into top-level scalars (as str) and lists of str.
 
-    Handles basic key: value pairs and simple lists (names: [...] or
-    names:\n  - item lines). Enough for YOLO data.yaml files.
+    Uses PyYAML (with the libyaml CSafeLoader when compiled in), so nested
+    forms such as `names: {0: cat, 1: dog}` are understood; mappings are
+    flattened to their values in key order. Falls back to a line parser if
+    the file is not valid YAML.
     """
-    result: dict[str, str | list[str]] = {}
     try:
         text = path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
-        return result
+        return {}
+
+    import yaml  # type: ignore[import-untyped]
+
+    try:
+        data = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError:
+        return _parse_yaml_lines(text)
+    if not isinstance(data, dict):
+        return {}
+
+    result: dict[str, str | list[str]] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            try:
+                value = [v for _, v in sorted(value.items())]
+            except TypeError:
+                value = list(value.values())
+        if value is None or isinstance(value, list):
+            result[str(key)] = [str(v) for v in value or ()]
+        else:
+            result[str(key)] = str(value)
+    return result
+
+
+def _parse_yaml_lines(text: str) -> dict[str, str | list[str]]:
+    """Line-based reader for the simple YAML subset used by data.yaml files.
 
+    Handles basic key: value pairs and simple lists (names: [...] or
+    names:\n  - item lines).
+    """
+    result: dict[str, str | list[str]] = {}
     lines = text.splitlines()
     current_key: str | None = None
     current_list: list[str] | None = None
@@ -145,7 +351,7 @@ def _parse_simple_yaml(path: Path) -> dict[str, str | list[str]]:
     return result
 
 
-def _try_yolo(root: Path) -> DatasetInfo | None:
+def _try_yolo(root: Path, scans: _TreeScans) -> DatasetInfo | None:
     """Detect YOLO format via data.yaml."""
     yaml_path = root / "data.yaml"
     if not yaml_path.is_file():
@@ -171,6 +377,7 @@ def _try_yolo(root: Path) -> DatasetInfo | None:
     splits: dict[str, int] = {}
     image_dirs: list[str] = []
 
+    candidates: list[tuple[str, Path]] = []
     for split_name in ("train", "val", "test"):
         split_val = parsed.get(split_name)
         if isinstance(split_val, str):
@@ -178,18 +385,18 @@ def _try_yolo(root: Path) -> DatasetInfo | None:
             # YOLO convention: images dir mirrors the path
             # data.yaml may point to images/train or just train
             if split_path.is_dir():
-                count = _count_images_in(split_path)
-                if count > 0:
-                    splits[split_name] = count
-                    image_dirs.append(str(split_path))
+                candidates.append((split_name, split_path))
                 continue
             # Try under images/
             img_split = root / "images" / split_name
             if img_split.is_dir():
-                count = _count_images_in(img_split)
-                if count > 0:
-                    splits[split_name] = count
-                    image_dirs.append(str(img_split))
+                candidates.append((split_name, img_split))
+
+    counts = _count_images_each([path for _, path in candidates], scans)
+    for (split_name, path), count in zip(candidates, counts):
+        if count > 0:
+            splits[split_name] = count
+            image_dirs.append(str(path))
 
     # Fallback: check images/ dir directly
     if not image_dirs:
@@ -202,14 +409,16 @@ def _try_yolo(root: Path) -> DatasetInfo | None:
     annotations_path = str(labels_dir) if labels_dir.is_dir() else None
 
     num_images = (
-        sum(splits.values()) if splits else sum(_count_images_in(Path(d)) for d in image_dirs)
+        sum(splits.values())
+        if splits
+        else sum(_count_images_in(Path(d), scans) for d in image_dirs)
     )
 
     return DatasetInfo(
         format="yolo",
         image_dirs=image_dirs or [str(root)],
         num_images=num_images,
-        estimated_size_bytes=_estimate_size(root),
+        estimated_size_bytes=_estimate_size(root, scans),
         splits=splits,
         num_classes=num_classes,
         class_names=class_names,
@@ -218,7 +427,7 @@ def _try_yolo(root: Path) -> DatasetInfo | None:
     )
 
 
-def _try_coco(root: Path) -> DatasetInfo | None:
+def _try_coco(root: Path, scans: _TreeScans) -> DatasetInfo | None:
     """Detect COCO format via annotations/*.json with COCO keys."""
     ann_dir = root / "annotations"
     if not ann_dir.is_dir():
@@ -228,20 +437,23 @@ def _try_coco(root: Path) -> DatasetInfo | None:
     if not json_files:
         return None
 
+    # Each file is parsed at most once, shared by COCO and split detection
+    summaries: dict[Path, tuple[int | None, list[Any], bool] | None] = {}
+
+    def summarize(jf: Path) -> tuple[int | None, list[Any], bool] | None:
+        if jf not in summaries:
+            summaries[jf] = _summarize_coco_json(jf)
+        return summaries[jf]
+
     # Check first JSON for COCO structure
     coco_file: Path | None = None
     categories: list[dict[str, str]] = []
     for jf in json_files:
-        try:
-            # Read first portion to check keys
-            with open(jf, encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "images" in data and "annotations" in data:
-                coco_file = jf
-                categories = data.get("categories", [])
-                break
-        except (json.JSONDecodeError, OSError):
-            continue
+        summary = summarize(jf)
+        if summary is not None and summary[2]:
+            coco_file = jf
+            categories = summary[1]
+            break
 
     if coco_file is None:
         return None
@@ -267,25 +479,21 @@ def _try_coco(root: Path) -> DatasetInfo | None:
         name = jf.stem.lower()
         for split_name in ("train", "val", "test"):
             if split_name in name:
-                try:
-                    with open(jf, encoding="utf-8") as f:
-                        data = json.load(f)
-                    if isinstance(data, dict) and "images" in data:
-                        splits[split_name] = len(data["images"])
-                except (json.JSONDecodeError, OSError):
-                    pass
+                summary = summarize(jf)
+                if summary is not None and summary[0] is not None:
+                    splits[split_name] = summary[0]
 
     num_images = (
         sum(splits.values())
         if splits
-        else (_count_images_in(images_dir) if images_dir.is_dir() else 0)
+        else (_count_images_in(images_dir, scans) if images_dir.is_dir() else 0)
     )
 
     return DatasetInfo(
         format="coco",
         image_dirs=image_dirs or [str(root)],
         num_images=num_images,
-        estimated_size_bytes=_estimate_size(root),
+        estimated_size_bytes=_estimate_size(root, scans),
         splits=splits,
         num_classes=num_classes,
         class_names=class_names,
@@ -294,7 +502,31 @@ def _try_coco(root: Path) -> DatasetInfo | None:
     )
 
 
-def _try_voc(root: Path) -> DatasetInfo | None:
+def _summarize_coco_json(path: Path) -> tuple[int | None, list[Any], bool] | None:
+    """Parse an annotation JSON once and keep only what detection needs.
+
+    Returns (image count or None, categories, has COCO keys), or None if the
+    file is unreadable or not a JSON object. The parsed document is dropped
+    before returning, so several large files are never held at once.
+    """
+    try:
+        raw = path.read_bytes()
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is strict about NaN/Infinity and huge integers; json is not
+            data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    images = data.get("images")
+    is_coco = "images" in data and "annotations" in data
+    categories = data.get("categories", []) if is_coco else []
+    return (len(images) if isinstance(images, list) else None), categories, is_coco
+
+
+def _try_voc(root: Path, scans: _TreeScans) -> DatasetInfo | None:
     """Detect Pascal VOC format via Annotations/ + JPEGImages/."""
     ann_dir = root / "Annotations"
     img_dir = root / "JPEGImages"
@@ -307,7 +539,7 @@ def _try_voc(root: Path) -> DatasetInfo | None:
     if not xml_files:
         return None
 
-    num_images = _count_images_in(img_dir)
+    num_images = _count_images_in(img_dir, scans)
 
     # Check for ImageSets/Main/ split files
     splits: dict[str, int] = {}
@@ -328,7 +560,7 @@ def _try_voc(root: Path) -> DatasetInfo | None:
         format="voc",
         image_dirs=[str(img_dir)],
         num_images=num_images,
-        estimated_size_bytes=_estimate_size(img_dir),
+        estimated_size_bytes=_estimate_size(img_dir, scans),
         splits=splits,
         num_classes=None,
         class_names=None,
@@ -337,7 +569,7 @@ def _try_voc(root: Path) -> DatasetInfo | None:
     )
 
 
-def _try_classification(root: Path) -> DatasetInfo | None:
+def _try_classification(root: Path, scans: _TreeScans) -> DatasetInfo | None:
     """Detect classification format: >3 subdirs each containing images."""
     # Skip if annotation-style dirs exist
     for ann_dir_name in ("labels", "annotations", "Annotations"):
@@ -349,20 +581,29 @@ def _try_classification(root: Path) -> DatasetInfo | None:
     if len(subdirs) < 3:
         return None
 
-    # Check that most subdirs contain images
-    counts: dict[str, int] = {}
-    total_images = 0
-    for sd in subdirs:
-        count = _count_images_in(sd)
-        counts[sd.name] = count
-        if count > 0:
-            total_images += count
-
-    dirs_with_images = sum(1 for c in counts.values() if c > 0)
-
-    # Require majority of subdirs to contain images
-    if dirs_with_images < len(subdirs) * 0.5:
+    # Require majority of subdirs to contain images. Probing stops at the first
+    # image in each subdir, so a rejected layout never pays for full tree walks;
+    # it also stops once the majority is met, since every remaining subdir is
+    # then counted anyway and a probe would only read it twice.
+    needed = math.ceil(len(subdirs) * 0.5)
+    with_images: list[Path] = []
+    for probed, sd in enumerate(subdirs):
+        if len(with_images) >= needed:
+            break
+        if len(with_images) + len(subdirs) - probed < needed:
+            return None
+        if _has_any_image(sd):
+            with_images.append(sd)
+    else:
+        probed = len(subdirs)
+    if len(with_images) < needed:
         return None
+    to_count = with_images + subdirs[probed:]
+
+    counts = dict.fromkeys((sd.name for sd in subdirs), 0)
+    for sd, count in zip(to_count, _count_images_each(to_count, scans)):
+        counts[sd.name] = count
+    total_images = sum(counts.values())
 
     class_names_all = sorted(name for name, c in counts.items() if c > 0)
 
@@ -370,7 +611,7 @@ def _try_classification(root: Path) -> DatasetInfo | None:
         format="classification",
         image_dirs=[str(root)],
         num_images=total_images,
-        estimated_size_bytes=_estimate_size(root),
+        estimated_size_bytes=_estimate_size(root, scans),
         splits={},
         num_classes=len(class_names_all),
         class_names=class_names_all[:10],
@@ -379,14 +620,14 @@ def _try_classification(root: Path) -> DatasetInfo | None:
     )
 
 
-def _build_flat(root: Path) -> DatasetInfo:
+def _build_flat(root: Path, scans: _TreeScans) -> DatasetInfo:
     """Fallback: flat directory with images."""
-    num_images = _count_images_in(root)
+    num_images = _count_images_in(root, scans)
     return DatasetInfo(
         format="flat",
         image_dirs=[str(root)],
         num_images=num_images,
-        estimated_size_bytes=_estimate_size(root) if num_images > 0 else 0,
+        estimated_size_bytes=_estimate_size(root, scans) if num_images > 0 else 0,
         splits={},
         num_classes=None,
         class_names=None,
@@ -8,6 +8,9 @@ from imgeda.core.duplicates import find_exact_duplicates
 from imgeda.models.manifest import ImageRecord
 from imgeda.models.policy import Policy
 
+# Example paths reported per failing check
+_MAX_SAMPLE_PATHS = 10
+
 
 @dataclass(slots=True)
 class CheckResult:
@@ -35,6 +38,19 @@ class GateResult:
         }
 
 
+@dataclass(slots=True)
+class _Tally:
+    """Count of records failing one check, with the first few failing paths."""
+
+    count: int = 0
+    samples: list[str] = field(default_factory=list)
+
+    def add(self, path: str) -> None:
+        self.count += 1
+        if len(self.samples) < _MAX_SAMPLE_PATHS:
+            self.samples.append(path)
+
+
 def evaluate_policy(records: list[ImageRecord], policy: Policy) -> GateResult:
     """Evaluate a manifest against a policy. Returns structured gate result."""
     total = len(records)
@@ -52,7 +68,46 @@ def evaluate_policy(records: list[ImageRecord], policy: Policy) -> GateResult:
         result.passed = False
         return result
 
-    valid = [r for r in records if not r.is_corrupt]
+    # Every per-record check is accumulated in one pass over the records
+    corrupt, overexposed, dark = _Tally(), _Tally(), _Tally()
+    blurry, artifacts = _Tally(), _Tally()
+    small, short, bad_fmt, extreme = _Tally(), _Tally(), _Tally(), _Tally()
+    allowed = {f.upper() for f in policy.allowed_formats}
+    min_width: int | None = None
+    min_height: int | None = None
+    max_aspect: float | None = None
+    phashes: list[str] = []
+    for r in records:
+        path = r.path
+        if r.is_overexposed:
+            overexposed.add(path)
+        if r.is_dark:
+            dark.add(path)
+        if r.is_blurry:
+            blurry.add(path)
+        if r.has_border_artifact:
+            artifacts.add(path)
+        if r.is_corrupt:
+            corrupt.add(path)
+            continue
+        if r.phash:
+            phashes.append(r.phash)
+
+        width, height, aspect = r.width, r.height, r.aspect_ratio
+        if min_width is None or width < min_width:
+            min_width = width
+        if min_height is None or height < min_height:
+            min_height = height
+        if max_aspect is None or aspect > max_aspect:
+            max_aspect = aspect
+        if width < policy.min_width:
+            small.add(path)
+        if height < policy.min_height:
+            short.add(path)
+        if allowed and r.format.upper() not in allowed:
+            bad_fmt.add(path)
+        if policy.max_aspect_ratio > 0 and aspect > policy.max_aspect_ratio:
+            extreme.add(path)
 
     # min_images_total
     result.checks.append(
@@ -65,141 +120,132 @@ def evaluate_policy(records: list[ImageRecord], policy: Policy) -> GateResult:
     )
 
     # max_corrupt_pct
-    corrupt = [r for r in records if r.is_corrupt]
-    corrupt_pct = len(corrupt) / total * 100
+    corrupt_pct = corrupt.count / total * 100
     result.checks.append(
         CheckResult(
             name="max_corrupt_pct",
             threshold=policy.max_corrupt_pct,
             observed=round(corrupt_pct, 2),
             passed=corrupt_pct <= policy.max_corrupt_pct,
-            sample_paths=[r.path for r in corrupt[:10]],
+            sample_paths=corrupt.samples,
         )
     )
 
     # max_overexposed_pct
-    overexposed = [r for r in records if r.is_overexposed]
-    overexposed_pct = len(overexposed) / total * 100
+    overexposed_pct = overexposed.count / total * 100
     result.checks.append(
         CheckResult(
             name="max_overexposed_pct",
             threshold=policy.max_overexposed_pct,
             observed=round(overexposed_pct, 2),
             passed=overexposed_pct <= policy.max_overexposed_pct,
-            sample_paths=[r.path for r in overexposed[:10]],
+            sample_paths=overexposed.samples,
         )
     )
 
     # max_underexposed_pct (dark images)
-    dark = [r for r in records if r.is_dark]
-    dark_pct = len(dark) / total * 100
+    dark_pct = dark.count / total * 100
     result.checks.append(
         CheckResult(
             name="max_underexposed_pct",
             threshold=policy.max_underexposed_pct,
             observed=round(dark_pct, 2),
             passed=dark_pct <= policy.max_underexposed_pct,
-            sample_paths=[r.path for r in dark[:10]],
+            sample_paths=dark.samples,
         )
     )
 
-    # max_duplicate_pct
-    dup_groups = find_exact_duplicates(records)
-    dup_count = sum(len(v) - 1 for v in dup_groups.values())
+    # max_duplicate_pct: every copy after the first of a phash is a duplicate.
+    # Records are only grouped when there is something to sample.
+    dup_count = len(phashes) - len(set(phashes))
     dup_pct = dup_count / total * 100
     dup_paths: list[str] = []
-    for group in dup_groups.values():
-        dup_paths.extend(r.path for r in group[1:])
-        if len(dup_paths) >= 10:
-            break
+    if dup_count:
+        for group in find_exact_duplicates(records).values():
+            dup_paths.extend(r.path for r in group[1:])
+            if len(dup_paths) >= _MAX_SAMPLE_PATHS:
+                break
     result.checks.append(
         CheckResult(
             name="max_duplicate_pct",
             threshold=policy.max_duplicate_pct,
             observed=round(dup_pct, 2),
             passed=dup_pct <= policy.max_duplicate_pct,
-            sample_paths=dup_paths[:10],
+            sample_paths=dup_paths[:_MAX_SAMPLE_PATHS],
         )
     )
 
     # max_blurry_pct
     if policy.max_blurry_pct < 100.0:
-        blurry = [r for r in records if r.is_blurry]
-        blurry_pct = len(blurry) / total * 100
+        blurry_pct = blurry.count / total * 100
         result.checks.append(
             CheckResult(
                 name="max_blurry_pct",
                 threshold=policy.max_blurry_pct,
                 observed=round(blurry_pct, 2),
                 passed=blurry_pct <= policy.max_blurry_pct,
-                sample_paths=[r.path for r in blurry[:10]],
+                sample_paths=blurry.samples,
             )
         )
 
     # max_artifact_pct
     if policy.max_artifact_pct < 100.0:
-        artifacts = [r for r in records if r.has_border_artifact]
-        artifact_pct = len(artifacts) / total * 100
+        artifact_pct = artifacts.count / total * 100
         result.checks.append(
             CheckResult(
                 name="max_artifact_pct",
                 threshold=policy.max_artifact_pct,
                 observed=round(artifact_pct, 2),
                 passed=artifact_pct <= policy.max_artifact_pct,
-                sample_paths=[r.path for r in artifacts[:10]],
+                sample_paths=artifacts.samples,
             )
         )
 
     # min_width
     if policy.min_width > 0:
-        small = [r for r in valid if r.width < policy.min_width]
         result.checks.append(
             CheckResult(
                 name="min_width",
                 threshold=float(policy.min_width),
-                observed=float(min((r.width for r in valid), default=0)),
-                passed=len(small) == 0,
-                sample_paths=[r.path for r in small[:10]],
+                observed=float(min_width or 0),
+                passed=small.count == 0,
+                sample_paths=small.samples,
             )
         )
 
     # min_height
     if policy.min_height > 0:
-        short = [r for r in valid if r.height < policy.min_height]
         result.checks.append(
             CheckResult(
                 name="min_height",
                 threshold=float(policy.min_height),
-                observed=float(min((r.height for r in valid), default=0)),
-                passed=len(short) == 0,
-                sample_paths=[r.path for r in short[:10]],
+                observed=float(min_height or 0),
+                passed=short.count == 0,
+                sample_paths=short.samples,
             )
         )
 
     # allowed_formats
     if policy.allowed_formats:
-        allowed = {f.upper() for f in policy.allowed_formats}
-        bad_fmt = [r for r in valid if r.format.upper() not in allowed]
         result.checks.append(
             CheckResult(
                 name="allowed_formats",
                 threshold=0.0,
-                observed=float(len(bad_fmt)),
-                passed=len(bad_fmt) == 0,
-                sample_paths=[r.path for r in bad_fmt[:10]],
+                observed=float(bad_fmt.count),
+                passed=bad_fmt.count == 0,
+                sample_paths=bad_fmt.samples,
             )
         )
 
     # max_aspect_ratio
     if policy.max_aspect_ratio > 0:
-        extreme = [r for r in valid if r.aspect_ratio > policy.max_aspect_ratio]
         result.checks.append(
             CheckResult(
                 name="max_aspect_ratio",
                 threshold=policy.max_aspect_ratio,
-                observed=round(max((r.aspect_ratio for r in valid), default=0.0), 2),
-                passed=len(extreme) == 0,
-                sample_paths=[r.path for r in extreme[:10]],
+                observed=round(max_aspect or 0.0, 2),
+                passed=extreme.count == 0,
+                sample_paths=extreme.samples,
             )
         )
 
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
+import string
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from imgeda.models.manifest import ImageRecord
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
 
 def detect_leakage(
     splits: dict[str, list[ImageRecord]],
@@ -56,67 +63,105 @@ def detect_leakage(
 def _hamming_distance(h1: str, h2: str) -> int:
     """Compute Hamming distance between two hex hash strings."""
     try:
-        i1 = int(h1, 16)
-        i2 = int(h2, 16)
-        return bin(i1 ^ i2).count("1")
+        return (int(h1, 16) ^ int(h2, 16)).bit_count()
     except (ValueError, TypeError):
         return 999
 
 
+def _pack_hashes(hashes: list[str], width: int) -> NDArray[np.uint64]:
+    """Pack hex hashes into rows of uint64 words.
+
+    Each hash is left-padded with zeros to width hex digits (a multiple of 16),
+    which keeps its integer value, so XOR + popcount over a row equals the
+    Hamming distance _hamming_distance computes on the parsed ints.
+    """
+    digits = "".join(h.rjust(width, "0") for h in hashes)
+    words = np.frombuffer(bytes.fromhex(digits), dtype=">u8")
+    return words.reshape(len(hashes), width // 16).astype(np.uint64)
+
+
 def _detect_near_leakage(
     splits: dict[str, list[ImageRecord]],
     threshold: int,
     leaked: list[dict[str, Any]],
     seen_paths: set[str],
 ) -> None:
-    """Find near-duplicate images across splits using sub-hash bucketing."""
-    # Build per-split hash lists
+    """Find near-duplicate images across splits using banded LSH over hash bits.
+
+    Every phash is parsed once into packed uint64 rows; the candidates of each
+    query are then verified together with one XOR + popcount over their rows.
+    """
+    # Build per-split hash lists. Hashes that are not plain hex can never be
+    # within threshold of anything (_hamming_distance scores them 999).
     split_hashes: list[tuple[str, list[tuple[str, str]]]] = []
     for split_name, records in splits.items():
-        hashes = [(r.phash, r.path) for r in records if r.phash]
+        hashes = [(r.phash, r.path) for r in records if r.phash and _HEX_DIGITS.issuperset(r.phash)]
         split_hashes.append((split_name, hashes))
 
     if len(split_hashes) < 2:
         return
 
+    longest = max((len(h) for _, hashes in split_hashes for h, _ in hashes), default=0)
+    width = -(-longest // 16) * 16
+    packed = [_pack_hashes([h for h, _ in hashes], width) for _, hashes in split_hashes]
+
+    # Banded LSH: split the bits into threshold + 1 disjoint bands. Two hashes
+    # within threshold bits of each other differ in at most threshold bands, so
+    # by pigeonhole they agree exactly on at least one and share its bucket.
+    nbits = width * 4
+    n_bands = threshold + 1
+    # Threshold at or above the bit count: every row is a candidate
+    match_all = n_bands > nbits
+    bounds = [nbits * k // n_bands for k in range(n_bands + 1)]
+    bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in itertools.pairwise(bounds)]
+    split_bands = [
+        [[(v >> lo) & mask for lo, mask in bands] for v in (int(h, 16) for h, _ in hashes)]
+        for _, hashes in split_hashes
+    ]
+
     # Compare each pair of splits
     for i in range(len(split_hashes)):
         for j in range(i + 1, len(split_hashes)):
             name_a, hashes_a = split_hashes[i]
             name_b, hashes_b = split_hashes[j]
+            packed_a, packed_b = packed[i], packed[j]
 
-            # Sub-hash bucketing for efficiency
-            buckets_b: dict[str, list[tuple[str, str]]] = {}
-            quarter = max(1, len(hashes_b[0][0]) // 4) if hashes_b else 4
-            for h, p in hashes_b:
-                for k in range(4):
-                    sub = h[k * quarter : (k + 1) * quarter]
-                    buckets_b.setdefault(sub, []).append((h, p))
+            buckets_b: list[dict[int, list[int]]] = [{} for _ in bands]
+            if not match_all:
+                for idx, row in enumerate(split_bands[j]):
+                    for bucket, value in zip(buckets_b, row):
+                        bucket.setdefault(value, []).append(idx)
 
-            for h_a, p_a in hashes_a:
+            for ia, (h_a, p_a) in enumerate(hashes_a):
                 if p_a in seen_paths:
                     continue
-                candidates: set[tuple[str, str]] = set()
-                for k in range(4):
-                    sub = h_a[k * quarter : (k + 1) * quarter]
-                    if sub in buckets_b:
-                        candidates.update(buckets_b[sub])
+                if match_all:
+                    idx_b = np.arange(len(hashes_b))
+                else:
+                    candidates: set[int] = set()
+                    for bucket, value in zip(buckets_b, split_bands[i][ia]):
+                        candidates.update(bucket.get(value, ()))
+                    # Sorted, so the earliest qualifying record in split b wins
+                    idx_b = np.sort(np.fromiter(candidates, dtype=np.intp, count=len(candidates)))
+                if not len(idx_b):
+                    continue
 
-                for h_b, p_b in candidates:
+                dists = np.bitwise_count(packed_b[idx_b] ^ packed_a[ia]).sum(axis=1)
+                for ib in idx_b[dists <= threshold].tolist():
+                    h_b, p_b = hashes_b[ib]
                     if p_b in seen_paths:
                         continue
                     if h_a == h_b:
                         continue  # Already caught by exact match
-                    if _hamming_distance(h_a, h_b) <= threshold:
-                        seen_paths.add(p_a)
-                        seen_paths.add(p_b)
-                        leaked.append(
-                            {
-                                "path": p_a,
-                                "phash": h_a,
-                                "found_in": sorted([name_a, name_b]),
-                                "match_type": "near",
-                                "matched_path": p_b,
-                            }
-                        )
-                        break
+                    seen_paths.add(p_a)
+                    seen_paths.add(p_b)
+                    leaked.append(
+                        {
+                            "path": p_a,
+                            "phash": h_a,
+                            "found_in": sorted([name_a, name_b]),
+                            "match_type": "near",
+                            "matched_path": p_b,
+                        }
+                    )
+                    break
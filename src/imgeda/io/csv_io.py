@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterable
 
 from imgeda.models.manifest import ImageRecord
 
@@ -60,17 +61,25 @@ def _flatten_record(rec: ImageRecord) -> dict[str, object]:
     return d
 
 
-def records_to_csv(records: list[ImageRecord], output_path: str) -> int:
-    """Write ImageRecords to a CSV file. Returns row count."""
-    if not records:
-        return 0
+def records_to_csv(records: Iterable[ImageRecord], output_path: str) -> int:
+    """Write ImageRecords to a CSV file, streaming one row at a time. Returns row count.
 
-    rows = [_flatten_record(r) for r in records]
-    fieldnames = list(rows[0].keys())
+    No file is written when there are no records.
+    """
+    it = iter(records)
+    first = next(it, None)
+    if first is None:
+        return 0
 
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    first_row = _flatten_record(first)
+    count = 1
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(first_row.keys())
+        writer.writerow(first_row.values())
+        for rec in it:
+            # _flatten_record always emits keys in the same order as the header
+            writer.writerow(_flatten_record(rec).values())
+            count += 1
 
-    return len(rows)
+    return count
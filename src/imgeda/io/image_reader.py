@@ -13,10 +13,58 @@ def discover_images(
     """Recursively discover image files under root, sorted by path."""
     root = Path(root)
     found: list[str] = []
-    ext_set = {e.lower() for e in extensions}
+    # str.endswith takes a tuple, so each name is matched in a single C call
+    suffixes = tuple({e.lower() for e in extensions})
     for dirpath, _dirnames, filenames in os.walk(root):
         for fn in filenames:
-            if any(fn.lower().endswith(ext) for ext in ext_set):
+            if fn.lower().endswith(suffixes):
                 found.append(os.path.join(dirpath, fn))
     found.sort()
     return found
+
+
+def filter_existing(paths: list[str]) -> list[str]:
+    """Return the paths that exist, preserving order.
+
+    Each parent directory is listed once with os.scandir and names are checked
+    against that listing, instead of one stat() per file. Symlinks are listed
+    even when dangling, so those alone are followed with os.path.exists.
+    """
+    listings: dict[str, tuple[set[str], set[str]]] = {}
+    kept: list[str] = []
+    for p in paths:
+        parent, name = os.path.split(p)
+        listing = listings.get(parent)
+        if listing is None:
+            names: set[str] = set()
+            links: set[str] = set()
+            try:
+                with os.scandir(parent or ".") as it:
+                    for entry in it:
+                        (links if entry.is_symlink() else names).add(entry.name)
+            except OSError:
+                pass
+            listing = listings[parent] = (names, links)
+        names, links = listing
+        if name in names or (name in links and os.path.exists(p)):
+            kept.append(p)
+    return kept
+
+
+def estimate_total_size(paths: list[str], sample: int = 1000) -> float:
+    """Estimate the total size of paths in bytes from the first `sample` files.
+
+    Only the sampled files are stat()ed, so the cost is independent of how many
+    files share their directories. Unreadable files are skipped rather than
+    abandoning the estimate.
+    """
+    head = paths[:sample]
+    if not head:
+        return 0.0
+    total = 0
+    for p in head:
+        try:
+            total += os.stat(p).st_size
+        except OSError:
+            continue
+    return total * len(paths) / len(head)
@@ -0,0 +1,42 @@
+"""JSON result export for check, diff, gate, and annotation commands."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+import orjson
+
+# Above this many items, indentation is dropped by default: it roughly triples
+# file size and doubles encoding time for large result lists.
+COMPACT_THRESHOLD = 10_000
+
+
+def write_json(
+    path: str | Path,
+    data: object,
+    compact: bool | None = None,
+    n_items: int = 0,
+) -> None:
+    """Write data as JSON.
+
+    When compact is None it is chosen automatically: indented output for small
+    payloads, compact output once n_items exceeds COMPACT_THRESHOLD.
+    """
+    if compact is None:
+        compact = n_items > COMPACT_THRESHOLD
+    option = 0 if compact else orjson.OPT_INDENT_2
+    Path(path).write_bytes(orjson.dumps(data, option=option))
+
+
+def write_jsonl(path: str | Path, items: Iterable[object]) -> int:
+    """Write items as JSON Lines while they are produced. Returns the item count.
+
+    Unlike write_json, the full result set never has to be resident in memory.
+    """
+    count = 0
+    with open(path, "wb") as f:
+        for item in items:
+            f.write(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE))
+            count += 1
+    return count
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import orjson
 
@@ -61,15 +63,38 @@ def create_manifest(path: str | Path, meta: ManifestMeta) -> None:
 
 
 def append_records(path: str | Path, records: list[ImageRecord]) -> None:
-    """Append records to JSONL manifest file."""
+    """Append records to JSONL manifest file.
+
+    orjson serializes the (slotted) dataclasses natively, producing the same JSON
+    as rec.to_dict() without building an intermediate dict per record.
+    """
     path = Path(path)
     with open(path, "ab") as f:
         for rec in records:
-            f.write(orjson.dumps(rec.to_dict(), option=orjson.OPT_APPEND_NEWLINE))
+            f.write(orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE))
         f.flush()
         os.fsync(f.fileno())
 
 
+def _iter_lines(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield decoded JSON objects per line, skipping blank and corrupt lines.
+
+    Lines are read from a binary handle and handed to orjson as bytes. Plain
+    iteration (rather than mmap) also works for pipes and process substitution,
+    and is safe if the manifest is truncated while being read.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Skip corrupt lines (likely truncated from crash)
+                continue
+
+
 def read_manifest(path: str | Path) -> tuple[ManifestMeta | None, list[ImageRecord]]:
     """Read a JSONL manifest, skipping corrupt trailing lines (crash tolerance)."""
     path = Path(path)
@@ -79,6 +104,20 @@ def read_manifest(path: str | Path) -> tuple[ManifestMeta | None, list[ImageReco
     meta: ManifestMeta | None = None
     records: list[ImageRecord] = []
 
+    for data in _iter_lines(path):
+        if data.get(MANIFEST_META_KEY) and meta is None:
+            meta = ManifestMeta.from_dict(data)
+        else:
+            records.append(ImageRecord.from_dict(data))
+
+    return meta, records
+
+
+def read_meta(path: str | Path) -> ManifestMeta | None:
+    """Read only the metadata header (the first line) of a manifest."""
+    path = Path(path)
+    if not path.exists():
+        return None
     with open(path, "rb") as f:
         for line in f:
             line = line.strip()
@@ -87,15 +126,27 @@ def read_manifest(path: str | Path) -> tuple[ManifestMeta | None, list[ImageReco
             try:
                 data = orjson.loads(line)
             except orjson.JSONDecodeError:
-                # Skip corrupt lines (likely truncated from crash)
-                continue
+                return None
+            if data.get(MANIFEST_META_KEY):
+                return ManifestMeta.from_dict(data)
+            return None
+    return None
 
-            if data.get(MANIFEST_META_KEY) and meta is None:
-                meta = ManifestMeta.from_dict(data)
-            else:
-                records.append(ImageRecord.from_dict(data))
 
-    return meta, records
+def iter_manifest(path: str | Path) -> Iterator[ImageRecord]:
+    """Stream records from a JSONL manifest one line at a time.
+
+    The metadata header and corrupt lines are skipped, so single-pass consumers
+    never hold the full record list in memory.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+
+    for data in _iter_lines(path):
+        if data.get(MANIFEST_META_KEY):
+            continue
+        yield ImageRecord.from_dict(data)
 
 
 def build_resume_set(records: list[ImageRecord]) -> set[tuple[str, int, float]]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import asdict
 from typing import Any
 
@@ -11,6 +12,20 @@ from imgeda.core.aggregator import aggregate
 from imgeda.models.manifest import MANIFEST_META_KEY, ImageRecord
 
 
+def _iter_records(body: bytes) -> Iterator[ImageRecord]:
+    for line in body.split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if data.get(MANIFEST_META_KEY):
+            continue
+        yield ImageRecord.from_dict(data)
+
+
 def handle(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Aggregate image records from a manifest into a dataset summary.
 
@@ -35,21 +50,8 @@ def handle(event: dict[str, Any], context: Any) -> dict[str, Any]:
     resp = s3.get_object(Bucket=bucket, Key=manifest_key)
     body = resp["Body"].read()
 
-    records: list[ImageRecord] = []
-    for line in body.split(b"\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = orjson.loads(line)
-        except orjson.JSONDecodeError:
-            continue
-        if data.get(MANIFEST_META_KEY):
-            continue
-        records.append(ImageRecord.from_dict(data))
-
-    # Aggregate
-    summary = aggregate(records)
+    # Aggregate while decoding, without building the record list
+    summary = aggregate(_iter_records(body))
     summary_dict = asdict(summary)
 
     # Upload summary JSON
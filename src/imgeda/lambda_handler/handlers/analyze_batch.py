@@ -65,7 +65,7 @@ def handle(event: dict[str, Any], context: Any) -> dict[str, Any]:
             record.path = f"s3://{source_bucket}/{key}"
             record.filename = os.path.basename(key)
 
-            lines.append(orjson.dumps(record.to_dict()))
+            lines.append(orjson.dumps(record))
             processed += 1
         except Exception:
             errors += 1
@@ -27,7 +27,7 @@ def handle(event: dict[str, Any], context: Any) -> dict[str, Any]:
     bucket = event["bucket"]
     prefix = event.get("prefix", "")
     batch_size = event.get("batch_size", DEFAULT_BATCH_SIZE)
-    extensions = tuple(event.get("extensions", DEFAULT_EXTENSIONS))
+    extensions = frozenset(event.get("extensions", DEFAULT_EXTENSIONS))
 
     s3 = boto3.client("s3")
     paginator = s3.get_paginator("list_objects_v2")
@@ -72,7 +72,7 @@ def handle(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     lines: list[bytes] = [orjson.dumps(meta.to_dict())]
     for rec in all_records:
-        lines.append(orjson.dumps(rec.to_dict()))
+        lines.append(orjson.dumps(rec))
 
     body_bytes = b"\n".join(lines) + b"\n"
     s3.put_object(Bucket=bucket, Key=output_key, Body=body_bytes)
@@ -45,3 +45,5 @@ class PlotConfig:
     figsize: tuple[float, float] = (9.0, 6.0)
     artifact_threshold: float = 50.0
     seed: int = 42
+    # Return plots as data: URIs encoded in memory instead of writing files
+    inline: bool = False
@@ -86,22 +86,21 @@ class ImageRecord:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ImageRecord:
-        ps = data.get("pixel_stats")
-        cs = data.get("corner_stats")
-        rec = cls(
-            **{
-                k: v
-                for k, v in data.items()
-                if k in cls.__dataclass_fields__ and k not in ("pixel_stats", "corner_stats")
-            }
-        )
-        if ps and isinstance(ps, dict):
-            rec.pixel_stats = PixelStats(**ps)
-        if cs and isinstance(cs, dict):
-            rec.corner_stats = CornerStats(**cs)
+        # Manifest lines normally carry exactly the record's fields, so the
+        # per-key filter only runs for lines with unknown (e.g. newer) keys.
+        if not data.keys() <= _RECORD_FIELDS:
+            data = {k: v for k, v in data.items() if k in _RECORD_FIELDS}
+        rec = cls(**data)
+        ps = rec.pixel_stats
+        cs = rec.corner_stats
+        rec.pixel_stats = PixelStats(**ps) if ps and isinstance(ps, dict) else None
+        rec.corner_stats = CornerStats(**cs) if cs and isinstance(cs, dict) else None
         return rec
 
 
+_RECORD_FIELDS = frozenset(ImageRecord.__dataclass_fields__)
+
+
 MANIFEST_META_KEY = "__manifest_meta__"
 
 
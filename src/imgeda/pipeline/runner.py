@@ -18,7 +18,7 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
-from imgeda.core.analyzer import analyze_image
+from imgeda.core.analyzer import analyze_images
 from imgeda.io.image_reader import discover_images
 from imgeda.io.manifest_io import append_records, create_manifest, write_meta
 from imgeda.models.config import ScanConfig
@@ -28,9 +28,12 @@ from imgeda.pipeline.signals import ShutdownHandler, worker_init
 
 console = Console()
 
-# Max futures in flight at once to bound memory usage
+# Max images in flight at once to bound memory usage
 _BATCH_SIZE = 5000
 
+# Images per pool task; amortizes pickling the config and IPC round-trips
+_CHUNK_SIZE = 16
+
 
 def run_scan(
     input_dir: str,
@@ -130,9 +133,10 @@ def _run_scan_inner(
                     break
 
                 batch = pending[batch_start : batch_start + _BATCH_SIZE]
-                futures: dict[Future[ImageRecord], str] = {
-                    executor.submit(analyze_image, path, config): path for path in batch
-                }
+                futures: dict[Future[list[ImageRecord]], list[str]] = {}
+                for i in range(0, len(batch), _CHUNK_SIZE):
+                    chunk = batch[i : i + _CHUNK_SIZE]
+                    futures[executor.submit(analyze_images, chunk, config)] = chunk
 
                 for future in as_completed(futures):
                     if shutdown.is_shutting_down:
@@ -142,25 +146,30 @@ def _run_scan_inner(
                         break
 
                     try:
-                        record = future.result(timeout=60)
+                        records = future.result(timeout=60)
                     except Exception:
-                        record = ImageRecord(
-                            path=futures[future],
-                            filename=os.path.basename(futures[future]),
-                            is_corrupt=True,
-                            analyzed_at=datetime.now(timezone.utc).isoformat(),
-                        )
-
-                    buffer.append(record)
-                    if record.is_corrupt:
-                        corrupt_count += 1
-                    if record.is_dark:
-                        dark_count += 1
-                    if record.is_overexposed:
-                        overexposed_count += 1
-
-                    total_done += 1
-                    progress.update(task, advance=1)
+                        analyzed_at = datetime.now(timezone.utc).isoformat()
+                        records = [
+                            ImageRecord(
+                                path=path,
+                                filename=os.path.basename(path),
+                                is_corrupt=True,
+                                analyzed_at=analyzed_at,
+                            )
+                            for path in futures[future]
+                        ]
+
+                    for record in records:
+                        buffer.append(record)
+                        if record.is_corrupt:
+                            corrupt_count += 1
+                        if record.is_dark:
+                            dark_count += 1
+                        if record.is_overexposed:
+                            overexposed_count += 1
+
+                    total_done += len(records)
+                    progress.update(task, advance=len(records))
 
                     # Checkpoint flush
                     if len(buffer) >= config.checkpoint_every:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import base64
+import io
 import random
+from collections.abc import Iterable, MutableMapping
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import matplotlib
 
@@ -38,46 +41,55 @@ COLORS = {
 }
 
 
+# rcParams set by apply_theme()
+_THEME: dict[str, Any] = {
+    "figure.facecolor": COLORS["bg"],
+    "axes.facecolor": COLORS["bg"],
+    "font.family": ["serif"],
+    "font.serif": [
+        "Palatino",
+        "Georgia",
+        "DejaVu Serif",
+        "serif",
+    ],
+    "font.size": 11,
+    "axes.titlesize": 16,
+    "axes.titleweight": "normal",
+    "axes.titlepad": 14,
+    "axes.labelsize": 12,
+    "axes.labelpad": 8,
+    "axes.labelweight": "normal",
+    "xtick.labelsize": 10,
+    "ytick.labelsize": 10,
+    "legend.fontsize": 10,
+    "axes.grid": False,
+    "axes.spines.top": False,
+    "axes.spines.right": False,
+    "axes.edgecolor": COLORS["light"],
+    "axes.linewidth": 0.6,
+    "xtick.direction": "in",
+    "ytick.direction": "in",
+    "xtick.color": COLORS["light"],
+    "ytick.color": COLORS["light"],
+    "xtick.labelcolor": COLORS["text"],
+    "ytick.labelcolor": COLORS["text"],
+    "axes.labelcolor": COLORS["text"],
+    "xtick.major.width": 0.6,
+    "ytick.major.width": 0.6,
+    "figure.dpi": 150,
+}
+
+
 def apply_theme() -> None:
-    """Apply Tufte-inspired theme: serif fonts, no grid, minimal chrome."""
-    plt.rcParams.update(
-        {
-            "figure.facecolor": COLORS["bg"],
-            "axes.facecolor": COLORS["bg"],
-            "font.family": "serif",
-            "font.serif": [
-                "Palatino",
-                "Georgia",
-                "DejaVu Serif",
-                "serif",
-            ],
-            "font.size": 11,
-            "axes.titlesize": 16,
-            "axes.titleweight": "normal",
-            "axes.titlepad": 14,
-            "axes.labelsize": 12,
-            "axes.labelpad": 8,
-            "axes.labelweight": "normal",
-            "xtick.labelsize": 10,
-            "ytick.labelsize": 10,
-            "legend.fontsize": 10,
-            "axes.grid": False,
-            "axes.spines.top": False,
-            "axes.spines.right": False,
-            "axes.edgecolor": COLORS["light"],
-            "axes.linewidth": 0.6,
-            "xtick.direction": "in",
-            "ytick.direction": "in",
-            "xtick.color": COLORS["light"],
-            "ytick.color": COLORS["light"],
-            "xtick.labelcolor": COLORS["text"],
-            "ytick.labelcolor": COLORS["text"],
-            "axes.labelcolor": COLORS["text"],
-            "xtick.major.width": 0.6,
-            "ytick.major.width": 0.6,
-            "figure.dpi": 150,
-        }
-    )
+    """Apply Tufte-inspired theme: serif fonts, no grid, minimal chrome.
+
+    Every plot calls this, so the validated rcParams update is skipped when the
+    theme is already in effect (checking is a plain lookup per key).
+    """
+    rc = cast("MutableMapping[str, Any]", plt.rcParams)
+    if all(rc[k] == v for k, v in _THEME.items()):
+        return
+    rc.update(_THEME)
 
 
 def tufte_axes(ax: Axes) -> None:
@@ -119,7 +131,24 @@ def create_figure(config: PlotConfig) -> tuple[Figure, Any]:
     return fig, ax
 
 
+_MIME_TYPES = {"png": "image/png", "svg": "image/svg+xml", "pdf": "application/pdf"}
+
+
 def save_figure(fig: Figure, name: str, config: PlotConfig) -> str:
+    """Save and close fig, returning its file path (or a data: URI if config.inline)."""
+    if config.inline:
+        buf = io.BytesIO()
+        fig.savefig(
+            buf,
+            format=config.format,
+            bbox_inches="tight",
+            dpi=config.dpi,
+            facecolor=COLORS["bg"],
+        )
+        plt.close(fig)
+        mime = _MIME_TYPES.get(config.format, f"image/{config.format}")
+        return f"data:{mime};base64,{base64.b64encode(buf.getvalue()).decode('ascii')}"
+
     out_dir = Path(config.output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{name}.{config.format}"
@@ -138,6 +167,26 @@ def sample_records(
     return rng.sample(records, max_samples)
 
 
+def reservoir_sample(
+    records: Iterable[ImageRecord], max_samples: int, seed: int = 42
+) -> list[ImageRecord]:
+    """Uniformly sample up to max_samples records in one pass (Algorithm R).
+
+    Memory is O(max_samples), so a large manifest can be sampled while it is
+    streamed. Like sample_records, all records are kept when there are fewer.
+    """
+    rng = random.Random(seed)
+    reservoir: list[ImageRecord] = []
+    for i, rec in enumerate(records):
+        if i < max_samples:
+            reservoir.append(rec)
+        else:
+            j = rng.randrange(i + 1)
+            if j < max_samples:
+                reservoir[j] = rec
+    return reservoir
+
+
 def valid_records(records: list[ImageRecord]) -> list[ImageRecord]:
     """Filter to non-corrupt records."""
     return [r for r in records if not r.is_corrupt]
@@ -0,0 +1,86 @@
+"""Registry of standard plots and a parallel renderer for drawing several at once."""
+
+from __future__ import annotations
+
+import importlib
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from imgeda.models.config import PlotConfig
+from imgeda.models.manifest import ImageRecord
+
+PlotFn = Callable[[list[ImageRecord], PlotConfig], str]
+
+# Plot name -> (display label, module, function). Modules are imported only when
+# a plot is actually drawn, so drawing one plot pays for one plotting module.
+PLOTS: dict[str, tuple[str, str, str]] = {
+    "dimensions": ("Dimensions", "imgeda.plotting.dimensions", "plot_dimensions"),
+    "file_size": ("File size", "imgeda.plotting.file_size", "plot_file_size"),
+    "aspect_ratio": ("Aspect ratio", "imgeda.plotting.aspect_ratio", "plot_aspect_ratio"),
+    "brightness": ("Brightness", "imgeda.plotting.pixel_stats", "plot_brightness"),
+    "channels": ("Channels", "imgeda.plotting.pixel_stats", "plot_channels"),
+    "blur": ("Blur", "imgeda.plotting.blur", "plot_blur"),
+    "artifacts": ("Artifacts", "imgeda.plotting.artifacts", "plot_artifacts"),
+    "duplicates": ("Duplicates", "imgeda.plotting.duplicates", "plot_duplicates"),
+    "exif_camera": ("Camera distribution", "imgeda.plotting.exif", "plot_camera_distribution"),
+    "exif_focal": ("Focal length", "imgeda.plotting.exif", "plot_focal_length"),
+    "exif_iso": ("ISO distribution", "imgeda.plotting.exif", "plot_iso_distribution"),
+}
+
+
+def plot_fn(name: str) -> PlotFn:
+    """Resolve a registered plot function, importing its module on first use."""
+    _label, module, func = PLOTS[name]
+    return getattr(importlib.import_module(module), func)  # type: ignore[no-any-return]
+
+
+# Records held by each pool worker, set once by _init_worker.
+_worker_records: list[ImageRecord] = []
+
+
+def _init_worker(records: list[ImageRecord]) -> None:
+    global _worker_records
+    _worker_records = records
+
+
+def _draw(name: str, config: PlotConfig) -> str:
+    return plot_fn(name)(_worker_records, config)
+
+
+def render_plots(
+    records: list[ImageRecord],
+    config: PlotConfig,
+    names: Sequence[str] | None = None,
+    workers: int | None = None,
+) -> Iterator[tuple[str, str | None, str | None]]:
+    """Draw plots in parallel, yielding (label, path, error) in registry order.
+
+    Matplotlib rendering is CPU-bound and each plot is independent, so plots are
+    spread over a process pool. Records reach each worker once through the pool
+    initializer (inherited for free under fork) rather than being pickled per
+    plot. A failing plot yields its error message instead of a path.
+    """
+    names = list(PLOTS) if names is None else list(names)
+    if workers is None:
+        workers = min(len(names), os.cpu_count() or 1)
+
+    if workers <= 1 or len(names) <= 1:
+        for name in names:
+            try:
+                yield PLOTS[name][0], plot_fn(name)(records, config), None
+            except Exception as e:
+                yield PLOTS[name][0], None, str(e)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(records,)
+    ) as pool:
+        futures: list[tuple[str, Future[str]]] = [
+            (name, pool.submit(_draw, name, config)) for name in names
+        ]
+        for name, future in futures:
+            try:
+                yield PLOTS[name][0], future.result(), None
+            except Exception as e:
+                yield PLOTS[name][0], None, str(e)
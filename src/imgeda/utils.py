@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 import html
 
 
+# (divisor, unit) from largest to smallest; a unit is used once b exceeds it
+_BYTE_UNITS = ((1_000_000_000, "GB"), (1_000_000, "MB"))
+
+
 def fmt_bytes(b: int | float) -> str:
     """Format byte count to human-readable string."""
-    if b > 1_000_000_000:
-        return f"{b / 1_000_000_000:.2f} GB"
-    if b > 1_000_000:
-        return f"{b / 1_000_000:.2f} MB"
+    for divisor, unit in _BYTE_UNITS:
+        if b > divisor:
+            return f"{b / divisor:.2f} {unit}"
     return f"{b / 1_000:.2f} KB"
 
 
+@functools.lru_cache(maxsize=4096)
 def escape_html(s: str) -> str:
-    """HTML-escape a string for safe embedding in reports."""
+    """HTML-escape a string for safe embedding in reports.
+
+    Cached: report tables repeat the same issue labels, formats and camera names
+    on many rows.
+    """
     return html.escape(s)
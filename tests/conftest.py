@@ -9,6 +9,14 @@ import pytest
 from PIL import Image
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep on-disk caches (e.g. format detection) out of the user's home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture
 def tmp_image_dir(tmp_path: Path) -> Path:
     """Create a directory with various programmatic test images."""
@@ -0,0 +1,67 @@
+"""Tests for dataset aggregation."""
+
+from __future__ import annotations
+
+from imgeda.core.aggregator import DatasetSummary, aggregate
+from imgeda.core.duplicates import find_exact_duplicates
+from imgeda.models.manifest import ImageRecord
+
+
+def _records() -> list[ImageRecord]:
+    return [
+        ImageRecord(path="/a.jpg", filename="a.jpg", width=10, height=20, format="JPEG"),
+        ImageRecord(path="/b.PNG", filename="b.PNG", width=30, height=5, format="PNG"),
+        ImageRecord(path="/c.jpg", filename="c.jpg", width=99, height=99, is_corrupt=True),
+    ]
+
+
+class TestAggregate:
+    def test_summary(self) -> None:
+        summary = aggregate(_records())
+        assert summary.total_images == 3
+        assert summary.corrupt_count == 1
+        assert (summary.min_width, summary.max_width) == (10, 30)
+        assert (summary.min_height, summary.max_height) == (5, 20)
+        assert summary.extension_counts == {"jpg": 2, "png": 1}
+
+    def test_accepts_iterator(self) -> None:
+        assert aggregate(iter(_records())) == aggregate(_records())
+
+    def test_empty(self) -> None:
+        assert aggregate([]) == DatasetSummary()
+        assert aggregate(iter([])) == DatasetSummary()
+
+    def test_flagged_preview(self) -> None:
+        records = _records() + [
+            ImageRecord(path="/d.jpg", filename="d.jpg", is_dark=True, is_blurry=True),
+        ]
+        summary = aggregate(records, flagged_limit=1)
+        assert summary.flagged_count == 2
+        assert summary.flagged_preview == [("/c.jpg", "c.jpg", "corrupt", 99, 99)]
+        full = aggregate(records, flagged_limit=10)
+        assert full.flagged_preview[1] == ("/d.jpg", "d.jpg", "dark, blurry", 0, 0)
+        assert aggregate(records).flagged_preview == []
+
+    def test_flagged_preview_all_issues(self) -> None:
+        record = ImageRecord(
+            path="/e.jpg",
+            filename="e.jpg",
+            is_dark=True,
+            is_overexposed=True,
+            is_blurry=True,
+            has_border_artifact=True,
+        )
+        summary = aggregate([record], flagged_limit=1)
+        assert summary.flagged_preview[0][2] == "dark, overexposed, blurry, artifact"
+
+    def test_exact_duplicate_count(self) -> None:
+        records = [
+            ImageRecord(path="/1.jpg", filename="1.jpg", phash="aa"),
+            ImageRecord(path="/2.jpg", filename="2.jpg", phash="aa"),
+            ImageRecord(path="/3.jpg", filename="3.jpg", phash="aa"),
+            ImageRecord(path="/4.jpg", filename="4.jpg", phash="bb"),
+            ImageRecord(path="/5.jpg", filename="5.jpg", phash="bb", is_corrupt=True),
+            ImageRecord(path="/6.jpg", filename="6.jpg"),
+        ]
+        expected = sum(len(g) - 1 for g in find_exact_duplicates(records).values())
+        assert aggregate(records).exact_duplicate_count == expected == 2
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
+from PIL import Image
 
-from imgeda.core.analyzer import analyze_image
+from imgeda.core.analyzer import analyze_image, analyze_images
 from imgeda.models.config import ScanConfig
 from imgeda.models.manifest import ImageRecord
 
@@ -37,6 +39,28 @@ class TestAnalyzeImage:
 
         assert record.is_corrupt
 
+    def test_truncated_file(self, single_image: str, tmp_path: Path) -> None:
+        data = Path(single_image).read_bytes()
+        truncated = tmp_path / "truncated.jpg"
+        truncated.write_bytes(data[: len(data) // 2])
+        record = analyze_image(str(truncated), ScanConfig())
+
+        assert record.is_corrupt
+
+    def test_corrupt_png_idat(self, tmp_path: Path) -> None:
+        """A flipped byte inside IDAT fails the chunk CRC and marks the record corrupt."""
+        good = tmp_path / "good.png"
+        Image.fromarray(np.random.randint(0, 255, (32, 32, 3), dtype=np.uint8)).save(good)
+        data = bytearray(good.read_bytes())
+        idat = data.index(b"IDAT")
+        data[idat + 10] ^= 0xFF
+        bad = tmp_path / "bad_idat.png"
+        bad.write_bytes(bytes(data))
+
+        config = ScanConfig(include_hashes=False)
+        assert not analyze_image(str(good), config).is_corrupt
+        assert analyze_image(str(bad), config).is_corrupt
+
     def test_nonexistent_file(self) -> None:
         config = ScanConfig()
         record = analyze_image("/nonexistent/image.jpg", config)
@@ -68,6 +92,33 @@ class TestAnalyzeImage:
         assert record.height == 3000
         assert record.pixel_stats is not None
 
+    def test_large_jpeg_matches_full_decode(self, large_image: str, tmp_path: Path) -> None:
+        # The JPEG is decoded at reduced scale; stats should match a PNG copy of
+        # the same pixels, which is decoded in full and resized with LANCZOS
+        png = tmp_path / "large.png"
+        Image.open(large_image).save(png)
+        config = ScanConfig(max_image_dimension=512, include_hashes=False)
+        drafted = analyze_image(large_image, config)
+        full = analyze_image(str(png), config)
+
+        assert (drafted.width, drafted.height) == (4000, 3000)
+        assert drafted.pixel_stats is not None and full.pixel_stats is not None
+        assert drafted.pixel_stats.mean_brightness == pytest.approx(
+            full.pixel_stats.mean_brightness, abs=1.0
+        )
+
+    def test_uniform_image_matches_full_stats(self, tmp_path: Path) -> None:
+        from imgeda.core.detector import compute_blur_score, compute_corner_stats
+
+        path = tmp_path / "solid.png"
+        Image.new("RGB", (64, 48), (90, 90, 90)).save(path)
+        record = analyze_image(str(path), ScanConfig(include_hashes=False))
+
+        pixels = np.asarray(Image.open(path).convert("RGB"))
+        assert record.corner_stats == compute_corner_stats(pixels)
+        assert record.blur_score == compute_blur_score(pixels) == 0.0
+        assert not record.has_border_artifact
+
     def test_dark_detection(self, tmp_image_dir: Path) -> None:
         config = ScanConfig()
         record = analyze_image(str(tmp_image_dir / "dark_001.png"), config)
@@ -94,6 +145,24 @@ class TestAnalyzeImage:
         assert record.corner_stats.delta > 50
 
 
+class TestAnalyzeImages:
+    def test_preserves_order(self, tmp_image_dir: Path) -> None:
+        paths = [
+            str(tmp_image_dir / "dark_001.png"),
+            "/nonexistent.jpg",
+            str(tmp_image_dir / "bright_001.png"),
+        ]
+        records = analyze_images(paths, ScanConfig(include_hashes=False))
+
+        assert [r.path for r in records] == paths
+        assert records[0].is_dark
+        assert records[1].is_corrupt
+        assert records[2].is_overexposed
+
+    def test_empty(self) -> None:
+        assert analyze_images([], ScanConfig()) == []
+
+
 class TestExifExtraction:
     def test_exif_camera_metadata(self, exif_image: str) -> None:
         config = ScanConfig()
@@ -438,3 +438,39 @@ class TestAnalyzeAnnotations:
         )
         assert "cat" in stats.co_occurrence
         assert "dog" in stats.co_occurrence["cat"]
+
+    def test_orphan_annotations(self, tmp_path: Path) -> None:
+        label_dir = tmp_path / "labels"
+        label_dir.mkdir()
+        image_dir = tmp_path / "images"
+        image_dir.mkdir()
+        for stem in ("a", "b.v2", "c"):
+            (label_dir / f"{stem}.txt").write_text("0 0.5 0.5 0.1 0.1\n")
+        (image_dir / "a.JPG").write_bytes(b"")
+        (image_dir / "b.v2.png").write_bytes(b"")
+        (image_dir / "c.txt").write_bytes(b"")
+
+        stats = analyze_annotations(
+            str(tmp_path), "yolo", label_dir=str(label_dir), image_dir=str(image_dir)
+        )
+        assert stats.orphan_annotations == ["c"]
+
+    def test_co_occurrence_counts(self, tmp_path: Path) -> None:
+        label_dir = tmp_path / "labels"
+        label_dir.mkdir()
+        (label_dir / "a.txt").write_text(
+            "0 0.5 0.5 0.1 0.1\n1 0.2 0.2 0.1 0.1\n1 0.3 0.3 0.1 0.1\n"
+        )
+        (label_dir / "b.txt").write_text(
+            "2 0.5 0.5 0.1 0.1\n1 0.2 0.2 0.1 0.1\n0 0.4 0.4 0.1 0.1\n"
+        )
+        (label_dir / "c.txt").write_text("2 0.5 0.5 0.1 0.1\n")
+
+        stats = analyze_annotations(
+            str(tmp_path), "yolo", label_dir=str(label_dir), class_names=["cat", "dog", "cow"]
+        )
+        assert stats.co_occurrence == {
+            "cat": {"dog": 2, "cow": 1},
+            "dog": {"cat": 2, "cow": 1},
+            "cow": {"cat": 1, "dog": 1},
+        }
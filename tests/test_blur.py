@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from imgeda.core.detector import compute_blur_score
 
@@ -44,3 +45,14 @@ class TestComputeBlurScore:
         blurry += np.random.randint(-2, 3, (100, 100, 3), dtype=np.int8).view(np.uint8)
 
         assert compute_blur_score(sharp) > compute_blur_score(blurry)
+
+    def test_matches_float_laplacian(self) -> None:
+        """The integer kernel equals the interior Laplacian of the grayscale mean."""
+        arr = np.random.default_rng(0).integers(0, 256, (40, 60, 3), dtype=np.uint8)
+        gray = arr.mean(axis=2)
+        neighbours = gray[:-2, 1:-1] + gray[2:, 1:-1] + gray[1:-1, :-2] + gray[1:-1, 2:]
+        lap = neighbours - 4 * gray[1:-1, 1:-1]
+        assert compute_blur_score(arr) == pytest.approx(float(lap.var()))
+
+    def test_too_small_for_kernel(self) -> None:
+        assert compute_blur_score(np.zeros((2, 50, 3), dtype=np.uint8)) == 0.0
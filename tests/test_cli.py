@@ -187,6 +187,33 @@ class TestPlotCLI:
         assert result.exit_code == 0
         assert Path(plots_dir).exists()
 
+    def test_plot_with_sample(self, manifest_for_plots: tuple[str, str]) -> None:
+        manifest, plots_dir = manifest_for_plots
+        result = runner.invoke(
+            app, ["plot", "dimensions", "-m", manifest, "-o", plots_dir, "--sample", "4"]
+        )
+        assert result.exit_code == 0
+        assert (Path(plots_dir) / "dimensions.png").exists()
+
+    @pytest.mark.parametrize("extra_args", [[], ["--sample", "4"]])
+    def test_plot_all_corrupt_manifest(self, tmp_path: Path, extra_args: list[str]) -> None:
+        """A manifest of only corrupt records plots the same with or without --sample."""
+        manifest = tmp_path / "corrupt_manifest.jsonl"
+        create_manifest(str(manifest), ManifestMeta(input_dir="/data", created_at="now"))
+        append_records(
+            str(manifest),
+            [
+                ImageRecord(path=f"/data/{i}.jpg", filename=f"{i}.jpg", is_corrupt=True)
+                for i in range(3)
+            ],
+        )
+        result = runner.invoke(
+            app,
+            ["plot", "dimensions", "-m", str(manifest), "-o", str(tmp_path / "plots"), *extra_args],
+        )
+        assert result.exit_code == 0
+        assert "No records found" not in result.output
+
     def test_plot_missing_manifest(self, tmp_path: Path) -> None:
         result = runner.invoke(
             app,
@@ -414,6 +441,26 @@ class TestCheckCommands:
         result = runner.invoke(app, ["check", "artifacts", "-m", manifest_with_issues])
         assert result.exit_code == 0
 
+    def test_check_exposure_jsonl(self, manifest_with_issues: str, tmp_path: Path) -> None:
+        out = tmp_path / "exposure.jsonl"
+        result = runner.invoke(
+            app,
+            [
+                "check",
+                "exposure",
+                "-m",
+                manifest_with_issues,
+                "-o",
+                str(out),
+                "--output-format",
+                "jsonl",
+            ],
+        )
+        assert result.exit_code == 0
+        lines = out.read_text().splitlines()
+        assert len(lines) == 2
+        assert '"dark"' in lines[0]
+
     def test_check_all(self, manifest_with_issues: str) -> None:
         result = runner.invoke(app, ["check", "all", "-m", manifest_with_issues])
         assert result.exit_code == 0
@@ -76,6 +76,16 @@ class TestRecordsToCsv:
         assert rows[0]["path"] == "/a.jpg"
         assert rows[1]["format"] == "PNG"
 
+    def test_accepts_iterator(self, tmp_path: Path) -> None:
+        records = (ImageRecord(path=f"/{i}.jpg", filename=f"{i}.jpg") for i in range(3))
+        out = str(tmp_path / "gen.csv")
+        assert records_to_csv(records, out) == 3
+
+        with open(out) as f:
+            rows = list(csv.DictReader(f))
+        assert [r["path"] for r in rows] == ["/0.jpg", "/1.jpg", "/2.jpg"]
+        assert rows[0]["is_corrupt"] == "False"
+
     def test_empty_records(self, tmp_path: Path) -> None:
         out = str(tmp_path / "empty.csv")
         count = records_to_csv([], out)
@@ -0,0 +1,57 @@
+"""Tests for exposure and artifact statistics."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from imgeda.core.detector import compute_corner_stats, compute_pixel_stats
+
+
+class TestComputePixelStats:
+    def test_matches_numpy_reductions(self) -> None:
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(10, 240, (37, 53, 3), dtype=np.uint8)
+        stats = compute_pixel_stats(pixels)
+
+        for i, (mean, std) in enumerate(
+            [(stats.mean_r, stats.std_r), (stats.mean_g, stats.std_g), (stats.mean_b, stats.std_b)]
+        ):
+            assert mean == pytest.approx(float(pixels[:, :, i].mean()))
+            assert std == pytest.approx(float(pixels[:, :, i].std()))
+        assert stats.mean_brightness == pytest.approx(float(pixels.mean(axis=2).mean()))
+        assert stats.min_val == int(pixels.min())
+        assert stats.max_val == int(pixels.max())
+
+    def test_uniform_image(self) -> None:
+        stats = compute_pixel_stats(np.full((4, 4, 3), 200, dtype=np.uint8))
+        assert stats.mean_brightness == 200.0
+        assert stats.std_r == stats.std_g == stats.std_b == 0.0
+        assert (stats.min_val, stats.max_val) == (200, 200)
+
+
+def _reference_corner_stats(pixels: np.ndarray, patch_fraction: float) -> tuple[float, float]:
+    h, w = pixels.shape[:2]
+    ph = max(1, int(h * patch_fraction))
+    pw = max(1, int(w * patch_fraction))
+    corners = [pixels[:ph, :pw], pixels[:ph, -pw:], pixels[-ph:, :pw], pixels[-ph:, -pw:]]
+    borders = [pixels[:ph, :], pixels[-ph:, :], pixels[:, :pw], pixels[:, -pw:]]
+    return (
+        float(np.concatenate([c.ravel() for c in corners]).mean()),
+        float(np.concatenate([b.ravel() for b in borders]).mean()),
+    )
+
+
+class TestComputeCornerStats:
+    @pytest.mark.parametrize("shape", [(40, 60, 3), (5, 3, 3), (1, 1, 3)])
+    def test_matches_concatenated_means(self, shape: tuple[int, int, int]) -> None:
+        pixels = np.random.default_rng(1).integers(0, 256, shape, dtype=np.uint8)
+        stats = compute_corner_stats(pixels, 0.1)
+        corner_mean, border_mean = _reference_corner_stats(pixels, 0.1)
+
+        assert stats.corner_mean == pytest.approx(corner_mean)
+        assert stats.border_mean == pytest.approx(border_mean)
+        h, w = shape[:2]
+        center = pixels[h // 4 : h - h // 4, w // 4 : w - w // 4]
+        assert stats.center_mean == pytest.approx(float(center.mean()))
+        assert stats.delta == pytest.approx(abs(corner_mean - stats.center_mean))
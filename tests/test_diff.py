@@ -89,6 +89,23 @@ class TestDiffManifests:
         assert result.summary.corrupt_old == 1
         assert result.summary.corrupt_new == 0
 
+    def test_duplicate_group_counts(self) -> None:
+        old = [
+            ImageRecord(path="/a.jpg", phash="aa"),
+            ImageRecord(path="/b.jpg", phash="aa"),
+            ImageRecord(path="/c.jpg", phash="bb"),
+            ImageRecord(path="/d.jpg", phash="bb", is_corrupt=True),
+        ]
+        new = [
+            ImageRecord(path="/a.jpg", phash="aa"),
+            ImageRecord(path="/b.jpg", phash="aa"),
+            ImageRecord(path="/c.jpg", phash="bb"),
+            ImageRecord(path="/d.jpg", phash="bb"),
+        ]
+        result = diff_manifests(old, new)
+        assert result.summary.duplicate_groups_old == 1
+        assert result.summary.duplicate_groups_new == 2
+
     def test_to_dict(self) -> None:
         old = [ImageRecord(path="/a.jpg", filename="a.jpg")]
         new = [ImageRecord(path="/b.jpg", filename="b.jpg")]
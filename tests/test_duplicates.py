@@ -68,3 +68,12 @@ class TestNearDuplicates:
             ImageRecord(path="/b.jpg", phash="0000000000000001", is_corrupt=True),
         ]
         assert find_near_duplicates(records) == []
+
+    def test_threshold_is_inclusive(self) -> None:
+        # 0x0f differs from 0x00 in exactly 4 bits
+        records = [
+            ImageRecord(path="/a.jpg", phash="000000000000000f"),
+            ImageRecord(path="/b.jpg", phash="0000000000000000"),
+        ]
+        assert len(find_near_duplicates(records, hamming_threshold=4)) == 1
+        assert find_near_duplicates(records, hamming_threshold=3) == []
@@ -216,6 +216,22 @@ class TestComputeEmbeddingsReal:
         norms = np.linalg.norm(embeddings, axis=1)
         np.testing.assert_allclose(norms, 1.0, atol=1e-5)
 
+    @requires_embeddings
+    @pytest.mark.timeout(120)
+    def test_unreadable_image_keeps_its_row(self, tmp_path: Path) -> None:
+        """A path that fails to decode still yields one embedding, in order."""
+        from PIL import Image
+
+        from imgeda.core.embeddings import compute_embeddings
+
+        good = tmp_path / "good.png"
+        Image.new("RGB", (32, 32), (200, 10, 10)).save(good)
+        paths = [str(good), str(tmp_path / "missing.jpg"), str(good)]
+
+        embeddings = compute_embeddings(paths, batch_size=2, device="cpu", num_workers=0)
+        assert embeddings.shape == (3, 512)
+        np.testing.assert_allclose(embeddings[0], embeddings[2], atol=1e-5)
+
     @requires_umap
     def test_umap_projection(self) -> None:
         """Test UMAP projection."""
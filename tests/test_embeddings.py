@@ -5,8 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from imgeda.core.embeddings import (
+    _default_num_workers,
     find_outliers,
     find_semantic_duplicates,
     load_embeddings,
@@ -80,6 +82,19 @@ class TestFindSemanticDuplicates:
             assert 0 <= sim <= 1.01  # allow small float imprecision
             assert idx_a < idx_b
 
+    def test_matches_pairwise_scan_across_chunks(self) -> None:
+        """Pairs spanning the 1000-row chunk boundary are found exactly once."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((1100, 8)).astype(np.float32)
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings[1050] = embeddings[3]
+
+        dupes = find_semantic_duplicates(embeddings, threshold=0.9)
+        sims = embeddings @ embeddings.T
+        expected = [(a, b) for a in range(1100) for b in range(a + 1, 1100) if sims[a, b] >= 0.9]
+        assert sorted((a, b) for a, b, _ in dupes) == expected
+        assert (3, 1050) in expected
+
 
 class TestSaveLoadEmbeddings:
     def test_roundtrip(self, tmp_path: Path) -> None:
@@ -103,3 +118,55 @@ class TestSaveLoadEmbeddings:
         loaded_emb, loaded_paths = load_embeddings(out)
         assert loaded_emb.shape == (0, 128)
         assert loaded_paths == []
+
+    def test_int8_roundtrip(self, tmp_path: Path) -> None:
+        embeddings = np.random.randn(20, 128).astype(np.float32)
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings[5] = 0.0
+        paths = [f"/img_{i}.jpg" for i in range(20)]
+        out = str(tmp_path / "embeddings.npz")
+
+        save_embeddings(embeddings, paths, out, quantize=True)
+        with np.load(out) as data:
+            assert data["embeddings"].dtype == np.int8
+
+        loaded_emb, loaded_paths = load_embeddings(out)
+        assert loaded_emb.dtype == np.float32
+        step = np.abs(embeddings).max(axis=1, keepdims=True) / 127
+        assert np.all(np.abs(loaded_emb - embeddings) <= step / 2 + 1e-7)
+        assert loaded_paths == paths
+
+    def test_npy_roundtrip_is_memory_mapped(self, tmp_path: Path) -> None:
+        embeddings = np.random.randn(20, 16).astype(np.float32)
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings[7] = embeddings[2]
+        paths = [f"/img_{i}.jpg" for i in range(20)]
+        out = str(tmp_path / "embeddings.npy")
+
+        save_embeddings(embeddings, paths, out)
+        assert (tmp_path / "embeddings.paths.json").exists()
+
+        loaded_emb, loaded_paths = load_embeddings(out)
+        assert isinstance(loaded_emb, np.memmap)
+        np.testing.assert_array_equal(loaded_emb, embeddings)
+        assert loaded_paths == paths
+        pairs = [(a, b) for a, b, _ in find_semantic_duplicates(loaded_emb, threshold=0.99)]
+        assert (2, 7) in pairs
+
+    def test_npy_rejects_quantize(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            save_embeddings(np.zeros((1, 4), np.float32), ["/a.jpg"], str(tmp_path / "e.npy"), True)
+
+
+class TestDefaultNumWorkers:
+    def test_cpu_decodes_in_process(self) -> None:
+        assert _default_num_workers(10_000, 32, "cpu") == 0
+        assert _default_num_workers(10_000, 32, "mps") == 0
+
+    def test_single_batch_decodes_in_process(self) -> None:
+        assert _default_num_workers(32, 32, "cuda") == 0
+
+    def test_capped_at_batch_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("os.cpu_count", lambda: 64)
+        assert _default_num_workers(65, 32, "cuda:0") == 3
+        assert _default_num_workers(10_000, 32, "cuda") == 8
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import numpy as np
+import pytest
 from PIL import Image
 
-from imgeda.core.format_detector import DatasetInfo, detect_format
+from imgeda.core import format_detector
+from imgeda.core.format_detector import DatasetInfo, detect_format, detect_format_cached
 
 
 def _create_image(path: Path, w: int = 100, h: int = 100) -> None:
@@ -56,6 +61,19 @@ class TestYoloDetection:
         assert info.num_classes == 3
         assert info.class_names == ["cat", "dog", "bird"]
 
+    def test_yolo_with_mapping_names(self, tmp_path: Path) -> None:
+        """Ultralytics-style `names: {id: name}` mappings are read in id order."""
+        (tmp_path / "data.yaml").write_text(
+            "path: .\ntrain: images/train\nnames:\n  1: dog\n  0: cat\n  2: bird\n"
+        )
+        _create_image(tmp_path / "images" / "train" / "img_0.jpg")
+
+        info = detect_format(str(tmp_path))
+        assert info.format == "yolo"
+        assert info.num_classes == 3
+        assert info.class_names == ["cat", "dog", "bird"]
+        assert info.splits == {"train": 1}
+
     def test_yolo_no_images(self, tmp_path: Path) -> None:
         """data.yaml exists but no images — still detects as YOLO."""
         (tmp_path / "data.yaml").write_text("nc: 2\nnames: [a, b]\n")
@@ -97,6 +115,29 @@ class TestCocoDetection:
         assert "train" in info.splits
         assert info.splits["train"] == 2
 
+    def test_coco_split_files_parsed_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ann_dir = tmp_path / "annotations"
+        ann_dir.mkdir()
+        train = {"images": [{"id": 1}, {"id": 2}], "annotations": [], "categories": []}
+        (ann_dir / "instances_train.json").write_text(json.dumps(train))
+        # NaN is valid for the stdlib json module but rejected by orjson
+        (ann_dir / "instances_val.json").write_text('{"images": [{"id": 3, "score": NaN}]}')
+
+        parsed: list[str] = []
+        real = format_detector._summarize_coco_json
+
+        def counting(path: Path) -> tuple[int | None, list[Any], bool] | None:
+            parsed.append(path.name)
+            return real(path)
+
+        monkeypatch.setattr(format_detector, "_summarize_coco_json", counting)
+        info = detect_format(str(tmp_path))
+        assert info.format == "coco"
+        assert info.splits == {"train": 2, "val": 1}
+        assert sorted(parsed) == ["instances_train.json", "instances_val.json"]
+
     def test_coco_no_categories(self, tmp_path: Path) -> None:
         ann_dir = tmp_path / "annotations"
         ann_dir.mkdir()
@@ -173,6 +214,27 @@ class TestClassificationDetection:
         assert "cat" in info.class_names
         assert info.num_images == 12
 
+    def test_classification_probes_until_majority(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Once most class folders are known to hold images, the rest are only counted."""
+        classes = ("a", "b", "c", "d", "e", "f")
+        for cls in classes:
+            _create_image(tmp_path / cls / "img_0.jpg")
+        probed: list[Path] = []
+        has_any_image = format_detector._has_any_image
+
+        def _counting(directory: Path) -> bool:
+            probed.append(directory)
+            return has_any_image(directory)
+
+        monkeypatch.setattr(format_detector, "_has_any_image", _counting)
+        info = detect_format(str(tmp_path))
+        assert info.format == "classification"
+        assert info.num_classes == 6
+        assert info.num_images == 6
+        assert len(probed) == 3
+
     def test_classification_needs_3_plus_subdirs(self, tmp_path: Path) -> None:
         """Only 2 subdirs should not match classification."""
         for cls in ("cat", "dog"):
@@ -215,6 +277,43 @@ class TestFlatDetection:
         assert info.format == "flat"
         assert info.num_images == 2
 
+    def test_extension_matching(self, tmp_path: Path) -> None:
+        """Extensions match case-insensitively and need a stem, like Path.suffix."""
+        for name in ("a.JPG", "b.png", "c.tar.webp", ".jpg", "jpg", "notes.txt"):
+            (tmp_path / name).write_bytes(b"x" * 10)
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "d.gif").write_bytes(b"x" * 10)
+        (tmp_path / "alias").symlink_to(tmp_path / "real")
+
+        info = detect_format(str(tmp_path))
+        assert info.num_images == 4
+        assert info.estimated_size_bytes == 40
+
+    def test_rescan_sees_new_images(self, tmp_path: Path) -> None:
+        """Tree scans are only shared within a single detect_format call."""
+        _create_image(tmp_path / "img_0.jpg")
+        assert detect_format(str(tmp_path)).num_images == 1
+
+        _create_image(tmp_path / "img_1.jpg")
+        assert detect_format(str(tmp_path)).num_images == 2
+
+    def test_root_walked_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Counting and sizing the same tree share a single walk."""
+        for i in range(3):
+            _create_image(tmp_path / f"img_{i}.jpg")
+        walked: list[str] = []
+        iter_entries = format_detector._iter_image_entries
+
+        def _counting(directory: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+            walked.append(str(directory))
+            return iter_entries(directory)
+
+        monkeypatch.setattr(format_detector, "_iter_image_entries", _counting)
+        info = detect_format(str(tmp_path))
+        assert info.num_images == 3
+        assert info.estimated_size_bytes > 0
+        assert walked.count(str(tmp_path)) == 1
+
 
 class TestDatasetInfo:
     def test_dataclass_defaults(self) -> None:
@@ -229,3 +328,62 @@ class TestDatasetInfo:
         assert info.class_names is None
         assert info.annotations_path is None
         assert info.extra == {}
+
+
+class TestDetectFormatCached:
+    def test_cache_hit_skips_detection(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        data = tmp_path / "data"
+        for i in range(3):
+            _create_image(data / f"img_{i}.jpg")
+        cache = tmp_path / "cache.json"
+
+        first = detect_format_cached(str(data), cache_path=cache)
+        assert first.format == "flat"
+        assert cache.exists()
+
+        def _fail(root: str) -> DatasetInfo:
+            raise AssertionError("detect_format should not run on a cache hit")
+
+        monkeypatch.setattr(format_detector, "detect_format", _fail)
+        assert detect_format_cached(str(data), cache_path=cache) == first
+
+    def test_structure_change_invalidates(self, tmp_path: Path) -> None:
+        data = tmp_path / "data"
+        _create_image(data / "img_0.jpg")
+        cache = tmp_path / "cache.json"
+
+        assert detect_format_cached(str(data), cache_path=cache).num_images == 1
+        _create_image(data / "img_1.jpg")
+        assert detect_format_cached(str(data), cache_path=cache).num_images == 2
+
+    def test_data_yaml_edit_invalidates(self, tmp_path: Path) -> None:
+        data = tmp_path / "data"
+        _create_image(data / "images" / "train" / "img_0.jpg")
+        yaml_path = data / "data.yaml"
+        yaml_path.write_text("train: images/train\nnames: [cat, dog]\n")
+        cache = tmp_path / "cache.json"
+
+        assert detect_format_cached(str(data), cache_path=cache).class_names == ["cat", "dog"]
+        yaml_path.write_text("train: images/train\nnames: [bird, fish, frog]\n")
+        info = detect_format_cached(str(data), cache_path=cache)
+        assert info.class_names == ["bird", "fish", "frog"]
+
+    def test_new_images_in_split_invalidate(self, tmp_path: Path) -> None:
+        data = tmp_path / "data"
+        _create_image(data / "images" / "train" / "img_0.jpg")
+        (data / "data.yaml").write_text("train: images/train\nnames: [cat]\n")
+        cache = tmp_path / "cache.json"
+
+        assert detect_format_cached(str(data), cache_path=cache).splits == {"train": 1}
+        _create_image(data / "images" / "train" / "img_1.jpg")
+        assert detect_format_cached(str(data), cache_path=cache).splits == {"train": 2}
+
+    def test_unreadable_cache_falls_back(self, tmp_path: Path) -> None:
+        data = tmp_path / "data"
+        _create_image(data / "img_0.jpg")
+        cache = tmp_path / "cache.json"
+        cache.write_bytes(b"not json")
+
+        assert detect_format_cached(str(data), cache_path=cache).num_images == 1
@@ -0,0 +1,40 @@
+"""Tests for perceptual hashing."""
+
+from __future__ import annotations
+
+import imagehash
+import numpy as np
+import pytest
+from PIL import Image
+
+from imgeda.core.hasher import compute_phash, hamming_distance
+
+
+class TestComputePhash:
+    @pytest.mark.parametrize("hash_size", [5, 8, 16])
+    def test_matches_imagehash(self, hash_size: int) -> None:
+        rng = np.random.default_rng(hash_size)
+        images = [
+            Image.fromarray(rng.integers(0, 256, (90, 120, 3), dtype=np.uint8)),
+            Image.new("RGB", (64, 48), (128, 128, 128)),
+        ]
+        halves = np.zeros((80, 80, 3), dtype=np.uint8)
+        halves[:40] = 200
+        images.append(Image.fromarray(halves))
+        for img in images:
+            assert compute_phash(img, hash_size) == str(imagehash.phash(img, hash_size=hash_size))
+
+
+class TestHammingDistance:
+    def test_matches_imagehash(self) -> None:
+        rng = np.random.default_rng(0)
+        a = Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        b = Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        ha, hb = str(imagehash.phash(a)), str(imagehash.phash(b))
+        expected = imagehash.hex_to_hash(ha) - imagehash.hex_to_hash(hb)
+        assert hamming_distance(ha, hb) == expected
+        assert hamming_distance(ha, ha) == 0
+
+    def test_size_mismatch(self) -> None:
+        with pytest.raises(TypeError):
+            hamming_distance("ff", "ffff")
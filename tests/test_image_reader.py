@@ -0,0 +1,56 @@
+"""Tests for image discovery helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from imgeda.io.image_reader import estimate_total_size, filter_existing
+
+
+class TestFilterExisting:
+    def test_keeps_existing_in_order(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "1.jpg").write_bytes(b"x")
+        (tmp_path / "a" / "2.jpg").write_bytes(b"x")
+        (tmp_path / "b.jpg").write_bytes(b"x")
+        paths = [
+            str(tmp_path / "a" / "2.jpg"),
+            str(tmp_path / "missing" / "3.jpg"),
+            str(tmp_path / "b.jpg"),
+            str(tmp_path / "a" / "4.jpg"),
+            str(tmp_path / "a" / "1.jpg"),
+        ]
+        assert filter_existing(paths) == [paths[0], paths[2], paths[4]]
+
+    def test_empty(self) -> None:
+        assert filter_existing([]) == []
+
+    def test_dangling_symlink_dropped(self, tmp_path: Path) -> None:
+        (tmp_path / "real.jpg").write_bytes(b"x")
+        (tmp_path / "live.jpg").symlink_to(tmp_path / "real.jpg")
+        (tmp_path / "dead.jpg").symlink_to(tmp_path / "gone.jpg")
+        paths = [str(tmp_path / "dead.jpg"), str(tmp_path / "live.jpg")]
+        assert filter_existing(paths) == [paths[1]]
+
+
+class TestEstimateTotalSize:
+    def test_sums_sampled_sizes(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "1.jpg").write_bytes(b"x" * 10)
+        (tmp_path / "b.jpg").write_bytes(b"x" * 30)
+        paths = [str(tmp_path / "a" / "1.jpg"), str(tmp_path / "b.jpg")]
+        assert estimate_total_size(paths) == 40
+
+    def test_extrapolates_from_sample(self, tmp_path: Path) -> None:
+        for i in range(4):
+            (tmp_path / f"{i}.jpg").write_bytes(b"x" * 5)
+        paths = sorted(str(p) for p in tmp_path.iterdir())
+        assert estimate_total_size(paths, sample=2) == 20
+
+    def test_missing_files_skipped(self, tmp_path: Path) -> None:
+        (tmp_path / "a.jpg").write_bytes(b"x" * 8)
+        paths = [str(tmp_path / "a.jpg"), str(tmp_path / "gone" / "b.jpg")]
+        assert estimate_total_size(paths) == 8
+
+    def test_empty(self) -> None:
+        assert estimate_total_size([]) == 0
@@ -0,0 +1,37 @@
+"""Tests for JSON result export."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+
+from imgeda.io.json_io import COMPACT_THRESHOLD, write_json, write_jsonl
+
+
+class TestWriteJson:
+    def test_small_payload_is_indented(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.json"
+        write_json(out, [{"path": "/a.jpg"}], n_items=1)
+        assert b"\n  " in out.read_bytes()
+        assert orjson.loads(out.read_bytes()) == [{"path": "/a.jpg"}]
+
+    def test_large_payload_is_compact(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.json"
+        write_json(out, [{"path": "/a.jpg"}], n_items=COMPACT_THRESHOLD + 1)
+        assert out.read_bytes() == b'[{"path":"/a.jpg"}]'
+
+    def test_explicit_flag_overrides_size(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.json"
+        write_json(out, {"a": 1}, compact=True)
+        assert out.read_bytes() == b'{"a":1}'
+        write_json(out, {"a": 1}, compact=False, n_items=COMPACT_THRESHOLD + 1)
+        assert out.read_bytes() == b'{\n  "a": 1\n}'
+
+
+class TestWriteJsonl:
+    def test_streams_generator(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.jsonl"
+        count = write_jsonl(out, ({"i": i} for i in range(3)))
+        assert count == 3
+        assert out.read_bytes() == b'{"i":0}\n{"i":1}\n{"i":2}\n'
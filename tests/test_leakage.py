@@ -63,6 +63,24 @@ class TestDetectLeakage:
         result = detect_leakage(splits, hamming_threshold=8)
         assert len(result) >= 1
 
+    def test_near_leakage_picks_first_candidate(self) -> None:
+        """With several near matches, the earliest record in the other split is reported."""
+        splits = {
+            "train": [_rec("/train/a.jpg", "aaaa0000"), _rec("/train/bad.jpg", "zzzz0000")],
+            "val": [_rec("/val/b1.jpg", "aaaa0001"), _rec("/val/b2.jpg", "aaaa0003")],
+        }
+        result = detect_leakage(splits, hamming_threshold=8)
+        assert [(r["path"], r["matched_path"]) for r in result] == [("/train/a.jpg", "/val/b1.jpg")]
+
+    def test_near_leakage_spread_across_hash(self) -> None:
+        """Differences spread over every part of the hash are still found."""
+        splits = {
+            "train": [_rec("/train/a.jpg", "0000000000000000")],
+            "val": [_rec("/val/b.jpg", "0003000300030003")],  # 8 bits, 2 per quarter
+        }
+        result = detect_leakage(splits, hamming_threshold=8)
+        assert [(r["path"], r["matched_path"]) for r in result] == [("/train/a.jpg", "/val/b.jpg")]
+
     def test_single_split_no_leakage(self) -> None:
         """A single split can't have cross-split leakage."""
         splits = {
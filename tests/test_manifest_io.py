@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 
+import orjson
+import pytest
+
 from imgeda.io.manifest_io import (
     append_records,
     build_resume_set,
+    iter_manifest,
     read_manifest,
+    read_meta,
     write_meta,
 )
 from imgeda.models.manifest import ImageRecord, ManifestMeta, PixelStats
@@ -110,3 +117,81 @@ class TestManifestIO:
         meta, records = read_manifest(str(path))
         assert meta is None
         assert records == []
+
+    def test_append_matches_to_dict_encoding(self, tmp_path: Path) -> None:
+        path = tmp_path / "manifest.jsonl"
+        rec = ImageRecord(
+            path="/data/a.jpg",
+            filename="a.jpg",
+            pixel_stats=PixelStats(mean_r=1.5),
+            phash="ab",
+            blur_score=12.5,
+        )
+        append_records(str(path), [rec])
+        assert path.read_bytes() == orjson.dumps(rec.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+
+    def test_iter_manifest_streams_records(self, tmp_path: Path) -> None:
+        path = tmp_path / "manifest.jsonl"
+        write_meta(str(path), ManifestMeta(input_dir="/data", created_at="now"))
+        append_records(
+            str(path),
+            [
+                ImageRecord(path="/data/a.jpg", filename="a.jpg", width=100),
+                ImageRecord(path="/data/b.jpg", filename="b.jpg", width=200),
+            ],
+        )
+        with open(path, "ab") as f:
+            f.write(b'{"path": "/data/c.jpg", "trunc')
+
+        loaded = list(iter_manifest(str(path)))
+        assert [r.path for r in loaded] == ["/data/a.jpg", "/data/b.jpg"]
+        assert loaded[1].width == 200
+
+    def test_iter_manifest_missing_file(self, tmp_path: Path) -> None:
+        assert list(iter_manifest(str(tmp_path / "nonexistent.jsonl"))) == []
+
+    def test_zero_byte_manifest(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.jsonl"
+        path.touch()
+        meta, records = read_manifest(str(path))
+        assert meta is None
+        assert records == []
+        assert list(iter_manifest(str(path))) == []
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_read_manifest_from_fifo(self, tmp_path: Path) -> None:
+        """Non-regular files such as pipes (e.g. -m <(zcat m.jsonl.gz)) are read too."""
+        src = tmp_path / "manifest.jsonl"
+        write_meta(str(src), ManifestMeta(input_dir="/data", created_at="now"))
+        append_records(str(src), [ImageRecord(path="/data/a.jpg", filename="a.jpg")])
+        fifo = tmp_path / "manifest.fifo"
+        os.mkfifo(fifo)
+
+        writer = threading.Thread(target=lambda: fifo.write_bytes(src.read_bytes()))
+        writer.start()
+        meta, records = read_manifest(str(fifo))
+        writer.join()
+        assert meta is not None
+        assert [r.path for r in records] == ["/data/a.jpg"]
+
+    def test_read_meta_only(self, tmp_path: Path) -> None:
+        path = tmp_path / "manifest.jsonl"
+        write_meta(str(path), ManifestMeta(input_dir="/data", created_at="now"))
+        append_records(str(path), [ImageRecord(path="/data/a.jpg", filename="a.jpg")])
+        meta = read_meta(str(path))
+        assert meta is not None
+        assert meta.input_dir == "/data"
+        assert read_meta(str(tmp_path / "nonexistent.jsonl")) is None
+
+    def test_from_dict_ignores_unknown_keys(self) -> None:
+        rec = ImageRecord.from_dict(
+            {
+                "path": "/a.jpg",
+                "future_field": 1,
+                "pixel_stats": {"mean_r": 3.0},
+                "corner_stats": {},
+            }
+        )
+        assert rec.path == "/a.jpg"
+        assert rec.pixel_stats == PixelStats(mean_r=3.0)
+        assert rec.corner_stats is None
@@ -9,7 +9,7 @@ import pytest
 
 from imgeda.models.config import PlotConfig
 from imgeda.models.manifest import CornerStats, ImageRecord, PixelStats
-from imgeda.plotting.base import COLORS, apply_theme, direct_label, tufte_axes
+from imgeda.plotting.base import COLORS, apply_theme, direct_label, reservoir_sample, tufte_axes
 
 
 @pytest.fixture
@@ -69,6 +69,12 @@ class TestBaseHelpers:
         assert plt.rcParams["ytick.labelcolor"] == COLORS["text"]
         assert plt.rcParams["xtick.color"] == COLORS["light"]
 
+    def test_apply_theme_reapplies_after_change(self) -> None:
+        apply_theme()
+        plt.rcParams["axes.grid"] = True
+        apply_theme()
+        assert plt.rcParams["axes.grid"] is False
+
     def test_tufte_axes_trims_spines(self) -> None:
         apply_theme()
         fig, ax = plt.subplots()
@@ -123,6 +129,15 @@ class TestBaseHelpers:
         for key in required:
             assert key in COLORS, f"Missing COLORS key: {key}"
 
+    def test_reservoir_sample_size_and_determinism(self, sample_records: list[ImageRecord]) -> None:
+        picked = reservoir_sample(iter(sample_records), 10, seed=7)
+        assert len(picked) == 10
+        assert len({r.path for r in picked}) == 10
+        assert picked == reservoir_sample(iter(sample_records), 10, seed=7)
+
+    def test_reservoir_sample_keeps_all_when_small(self, sample_records: list[ImageRecord]) -> None:
+        assert reservoir_sample(iter(sample_records), 100) == sample_records
+
 
 class TestFileSizeHelpers:
     """Tests for file_size.py auto-unit and adaptive bin helpers."""
@@ -273,3 +288,50 @@ class TestPlots:
         config = PlotConfig(output_dir=str(tmp_path))
         path = plot_dimensions(tiny_records, config)
         assert Path(path).exists()
+
+
+class TestInlinePlots:
+    def test_inline_returns_data_uri(
+        self, sample_records: list[ImageRecord], tmp_path: Path
+    ) -> None:
+        import base64
+
+        from imgeda.plotting.dimensions import plot_dimensions
+
+        config = PlotConfig(output_dir=str(tmp_path / "unused"), inline=True)
+        uri = plot_dimensions(sample_records, config)
+        prefix = "data:image/png;base64,"
+        assert uri.startswith(prefix)
+        assert base64.b64decode(uri[len(prefix) :]).startswith(b"\x89PNG")
+        assert not (tmp_path / "unused").exists()
+
+
+class TestRenderPlots:
+    NAMES = ("dimensions", "file_size", "brightness")
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_draws_in_registry_order(
+        self, sample_records: list[ImageRecord], tmp_path: Path, workers: int
+    ) -> None:
+        from imgeda.plotting.registry import PLOTS, render_plots
+
+        config = PlotConfig(output_dir=str(tmp_path))
+        results = list(render_plots(sample_records, config, self.NAMES, workers=workers))
+        assert [label for label, _, _ in results] == [PLOTS[n][0] for n in self.NAMES]
+        for _label, path, error in results:
+            assert error is None
+            assert path is not None and Path(path).exists()
+
+    def test_failure_reported_per_plot(
+        self, sample_records: list[ImageRecord], tmp_path: Path
+    ) -> None:
+        from imgeda.plotting.registry import render_plots
+
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        config = PlotConfig(output_dir=str(blocker))
+        results = list(render_plots(sample_records, config, ["file_size"], workers=1))
+        assert len(results) == 1
+        _label, path, error = results[0]
+        assert path is None
+        assert error
@@ -0,0 +1,22 @@
+"""Tests for shared utilities."""
+
+from __future__ import annotations
+
+from imgeda.utils import escape_html, fmt_bytes
+
+
+class TestFmtBytes:
+    def test_units(self) -> None:
+        assert fmt_bytes(512) == "0.51 KB"
+        assert fmt_bytes(2_500_000) == "2.50 MB"
+        assert fmt_bytes(3_210_000_000) == "3.21 GB"
+
+    def test_thresholds_are_exclusive(self) -> None:
+        assert fmt_bytes(1_000_000) == "1000.00 KB"
+        assert fmt_bytes(1_000_000_000) == "1000.00 MB"
+
+
+class TestEscapeHtml:
+    def test_escapes(self) -> None:
+        assert escape_html('<a href="x">&</a>') == "&lt;a href=&quot;x&quot;&gt;&amp;&lt;/a&gt;"
+        assert escape_html("plain") == "plain"